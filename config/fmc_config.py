@@ -3,30 +3,118 @@ Configuration management for Cisco FMC API automation.
 Loads settings from environment variables with validation.
 """
 
+import json
 import os
+from functools import lru_cache
 from typing import Optional
-from dotenv import load_dotenv
+from dotenv import dotenv_values, find_dotenv
+
+# Set once the .env file has been applied to this process (and its children)
+_DOTENV_SENTINEL = '_FMC_DOTENV_LOADED'
+_ENV_CACHE_NAME = '.env.cache.json'
+
+# Accepted spellings for boolean settings
+_TRUE_SET = frozenset({'1', 'true', 'True', 'TRUE', 'yes', 'Yes', 'YES', 'on', 'ON'})
+
+# Integer settings: attribute -> (environment variable, default)
+_INT_SETTINGS = {
+    'max_requests_per_minute': ('MAX_REQUESTS_PER_MINUTE', 100),
+    'api_timeout': ('API_TIMEOUT', 30),
+}
+
+
+def _compile_env_cache(path: str) -> dict:
+    """
+    Load a .env file, reusing a parsed JSON copy while the file is unchanged.
+    
+    The cache is written next to the .env file and keyed by its mtime, so
+    any edit to .env invalidates it. It holds the same secrets as .env and
+    is therefore created with owner-only permissions.
+    
+    Args:
+        path: Path to the .env file
+    
+    Returns:
+        Dictionary of variables defined in the file
+    """
+    mtime = os.stat(path).st_mtime_ns
+    cache_path = os.path.join(os.path.dirname(path), _ENV_CACHE_NAME)
+    
+    try:
+        with open(cache_path, 'r') as f:
+            cached = json.load(f)
+        if cached.get('mtime') == mtime:
+            return cached['values']
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    
+    # Cold start: parse with python-dotenv and refresh the cache
+    values = {k: v for k, v in dotenv_values(path).items() if v is not None}
+    
+    try:
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'mtime': mtime, 'values': values}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    
+    return values
+
+
+def _load_env_file():
+    """Apply .env to the process environment once, without overriding it."""
+    if os.environ.get(_DOTENV_SENTINEL):
+        return
+    
+    path = find_dotenv()
+    if path:
+        for key, value in _compile_env_cache(path).items():
+            os.environ.setdefault(key, value)
+    
+    os.environ[_DOTENV_SENTINEL] = '1'
+
 
 # Load environment variables
-load_dotenv()
+_load_env_file()
 
 
 class FMCConfig:
     """FMC Configuration settings."""
     
+    __slots__ = (
+        'host', 'username', 'password', 'verify_ssl', 'ca_cert', 'log_level',
+        'max_requests_per_minute', 'api_timeout', 'token_cache',
+        'base_url', 'platform_url', 'verify_param', '_repr'
+    )
+    
     def __init__(self):
         """Initialize configuration from environment variables."""
-        self.host = os.getenv('FMC_HOST')
-        self.username = os.getenv('FMC_USERNAME')
-        self.password = os.getenv('FMC_PASSWORD')
-        self.verify_ssl = os.getenv('FMC_VERIFY_SSL', 'true').lower() == 'true'
-        self.ca_cert = os.getenv('FMC_CA_CERT')
-        self.log_level = os.getenv('LOG_LEVEL', 'INFO')
-        self.max_requests_per_minute = int(os.getenv('MAX_REQUESTS_PER_MINUTE', '100'))
-        self.api_timeout = int(os.getenv('API_TIMEOUT', '30'))
+        # Read everything from a single environment lookup table
+        get = os.environ.get
+        
+        self.host = get('FMC_HOST')
+        self.username = get('FMC_USERNAME')
+        self.password = get('FMC_PASSWORD')
+        self.verify_ssl = get('FMC_VERIFY_SSL', 'true') in _TRUE_SET
+        self.ca_cert = get('FMC_CA_CERT')
+        self.log_level = get('LOG_LEVEL', 'INFO')
+        self.token_cache = get('FMC_TOKEN_CACHE', 'false') in _TRUE_SET
+        
+        # Empty values fall back to the default instead of failing int()
+        for attr, (key, default) in _INT_SETTINGS.items():
+            setattr(self, attr, int(get(key) or default))
         
         # Validate required settings
         self._validate()
+        
+        # Derived values are fixed for the lifetime of the config
+        self.base_url = f"https://{self.host}/api/fmc_config/v1"
+        self.platform_url = f"https://{self.host}/api/fmc_platform/v1"
+        self.verify_param = self.ca_cert or self.verify_ssl
+        self._repr = (f"FMCConfig(host={self.host}, username={self.username}, "
+                      f"verify_ssl={self.verify_ssl})")
     
     def _validate(self):
         """Validate required configuration parameters."""
@@ -37,23 +125,24 @@ class FMCConfig:
         if not self.password:
             raise ValueError("FMC_PASSWORD is required in environment variables")
     
-    @property
-    def base_url(self) -> str:
-        """Get the base API URL."""
-        return f"https://{self.host}/api/fmc_config/v1"
-    
-    @property
-    def platform_url(self) -> str:
-        """Get the platform API URL."""
-        return f"https://{self.host}/api/fmc_platform/v1"
-    
     def get_verify_param(self) -> bool | str:
         """Get SSL verification parameter for requests library."""
-        if self.ca_cert:
-            return self.ca_cert
-        return self.verify_ssl
+        return self.verify_param
     
     def __repr__(self):
         """String representation (masks password)."""
-        return (f"FMCConfig(host={self.host}, username={self.username}, "
-                f"verify_ssl={self.verify_ssl})")
+        return self._repr
+
+
+@lru_cache(maxsize=1)
+def get_config() -> FMCConfig:
+    """
+    Get the shared configuration instance.
+    
+    The environment is parsed once per process; every FMCClient created
+    without an explicit config reuses this instance.
+    
+    Returns:
+        Cached FMCConfig instance
+    """
+    return FMCConfig()
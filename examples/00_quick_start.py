@@ -12,49 +12,68 @@ Run this after configuring your .env file.
 """
 
 import sys
-import os
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from concurrent.futures import ThreadPoolExecutor
 
 from lib.fmc_client import FMCClient
 
+# Shared read-only stand-in for missing nested dicts in API responses
+_EMPTY = {}
+
+
+def step(message: str):
+    """Print a step header and flush the output buffered so far."""
+    print(message)
+    sys.stdout.flush()
+
 
 def main():
     """Quick start automation example."""
     
+    # Block-buffer stdout; output is flushed once per step instead of per line
+    sys.stdout.reconfigure(line_buffering=False)
+    
     print("=" * 70)
     print("FMC Automation Quick Start")
     print("=" * 70)
     
     # Step 1: Connect to FMC
-    print("\n[Step 1] Connecting to FMC...")
+    step("\n[Step 1] Connecting to FMC...")
     
     with FMCClient() as client:
         print("✓ Connected and authenticated successfully")
         
+        # The read-only steps are independent, so issue them concurrently
+        # and display the results in step order below
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            f_info = executor.submit(client.get, "info/serverversion")
+            f_hosts = executor.submit(client.get, "object/hosts", params={"limit": 5})
+            f_policies = executor.submit(client.get, "policy/accesspolicies")
+            f_devices = executor.submit(client.get, "devices/devicerecords", params={"limit": 5})
+        
         # Step 2: Get system information
-        print("\n[Step 2] Retrieving system information...")
+        step("\n[Step 2] Retrieving system information...")
         
-        system_info = client.get("info/serverversion")
+        system_info = f_info.result()
         if system_info and system_info.get('items'):
             info = system_info['items'][0]
             print(f"✓ FMC Version: {info.get('serverVersion')}")
             print(f"  Build: {info.get('build')}")
         
         # Step 3: List existing network objects
-        print("\n[Step 3] Retrieving existing network objects...")
+        step("\n[Step 3] Retrieving existing network objects...")
         
-        hosts = client.get("object/hosts", params={"limit": 5})
-        if hosts and hosts.get('items'):
-            count = hosts.get('paging', {}).get('count', 0)
+        hosts = f_hosts.result() or _EMPTY
+        host_items = hosts.get('items') or []
+        if host_items:
+            count = (hosts.get('paging') or _EMPTY).get('count', 0)
             print(f"✓ Found {count} host objects (showing first 5):")
-            for host in hosts['items'][:5]:
+            for host in host_items[:5]:
                 print(f"  • {host.get('name')}: {host.get('value')}")
         else:
             print("  No host objects found")
         
         # Step 4: Create a simple host object
-        print("\n[Step 4] Creating a test host object...")
+        step("\n[Step 4] Creating a test host object...")
         
         new_host = {
             "name": "QuickStart_Test_Host",
@@ -70,33 +89,35 @@ def main():
             host_id = result.get('id')
             
             # Clean up - delete the test object
-            print("\n[Step 5] Cleaning up test object...")
+            step("\n[Step 5] Cleaning up test object...")
             if client.delete(f"object/hosts/{host_id}"):
                 print("✓ Test object deleted")
         else:
             print("✗ Failed to create host object")
         
         # Step 6: List access policies
-        print("\n[Step 6] Retrieving access policies...")
+        step("\n[Step 6] Retrieving access policies...")
         
-        policies = client.get("policy/accesspolicies")
-        if policies and policies.get('items'):
-            print(f"✓ Found {len(policies['items'])} access policies:")
-            for policy in policies['items']:
+        policies = f_policies.result() or _EMPTY
+        policy_items = policies.get('items') or []
+        if policy_items:
+            print(f"✓ Found {len(policy_items)} access policies:")
+            for policy in policy_items:
                 print(f"  • {policy.get('name')}")
         else:
             print("  No access policies found")
         
         # Step 7: Check for managed devices
-        print("\n[Step 7] Checking managed devices...")
+        step("\n[Step 7] Checking managed devices...")
         
-        devices = client.get("devices/devicerecords", params={"limit": 5})
-        if devices and devices.get('items'):
-            count = devices.get('paging', {}).get('count', 0)
+        devices = f_devices.result() or _EMPTY
+        device_items = devices.get('items') or []
+        if device_items:
+            count = (devices.get('paging') or _EMPTY).get('count', 0)
             print(f"✓ Found {count} managed devices:")
-            for device in devices['items']:
+            for device in device_items:
                 print(f"  • {device.get('name')} ({device.get('model')})")
-                metadata = device.get('metadata', {})
+                metadata = device.get('metadata') or _EMPTY
                 deploy_status = metadata.get('deploymentStatus', 'UNKNOWN')
                 print(f"    Deployment status: {deploy_status}")
         else:
@@ -131,5 +152,7 @@ if __name__ == "__main__":
         print("  4. Check FMC REST API is enabled")
         print("  5. Review logs for detailed error information")
         
+        sys.stdout.flush()
+        
         import traceback
         traceback.print_exc()
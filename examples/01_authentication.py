@@ -9,14 +9,9 @@ Demonstrates:
 - Retrieving system information
 """
 
-import sys
-import os
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import time
 
 from lib.fmc_client import FMCClient
-from config.fmc_config import FMCConfig
 
 
 def basic_authentication():
@@ -41,62 +36,54 @@ def basic_authentication():
         print("\n✗ Authentication failed")
 
 
-def context_manager_example():
+def context_manager_example(client: FMCClient):
     """Using context manager for automatic cleanup."""
     print("\n" + "=" * 60)
     print("Example 2: Context Manager Usage")
     print("=" * 60)
     
-    # Context manager automatically handles auth and logout
-    with FMCClient() as client:
-        print("\n✓ Automatically authenticated")
-        
-        # Get system information
-        system_info = client.get("info/serverversion")
-        
-        if system_info:
-            print("\nFMC System Information:")
-            for item in system_info.get('items', []):
-                print(f"  Version: {item.get('serverVersion')}")
-                print(f"  Build: {item.get('build')}")
-                print(f"  Type: {item.get('type')}")
-        
-    print("\n✓ Automatically logged out")
+    # The context manager in main() handles auth and logout
+    print("\n✓ Automatically authenticated")
+    
+    # Get system information
+    system_info = client.get("info/serverversion")
+    
+    if system_info:
+        print("\nFMC System Information:")
+        for item in system_info.get('items', []):
+            print(f"  Version: {item.get('serverVersion')}")
+            print(f"  Build: {item.get('build')}")
+            print(f"  Type: {item.get('type')}")
 
 
-def get_domain_info():
+def get_domain_info(client: FMCClient):
     """Retrieve domain information."""
     print("\n" + "=" * 60)
     print("Example 3: Domain Information")
     print("=" * 60)
     
-    with FMCClient() as client:
-        # Get domains
-        domains = client.get("info/domain")
-        
-        if domains:
-            print("\nAvailable Domains:")
-            for item in domains.get('items', []):
-                print(f"  Name: {item.get('name')}")
-                print(f"  UUID: {item.get('uuid')}")
-                print(f"  Type: {item.get('type')}")
-                print()
+    # Get domains
+    domains = client.get("info/domain")
+    
+    if domains:
+        print("\nAvailable Domains:")
+        for item in domains.get('items', []):
+            print(f"  Name: {item.get('name')}")
+            print(f"  UUID: {item.get('uuid')}")
+            print(f"  Type: {item.get('type')}")
+            print()
 
 
-def token_refresh_example():
+def token_refresh_example(client: FMCClient):
     """Demonstrate automatic token refresh."""
     print("\n" + "=" * 60)
     print("Example 4: Token Refresh (Automatic)")
     print("=" * 60)
     
-    client = FMCClient()
-    client.authenticate()
-    
-    print(f"\n✓ Initial authentication")
+    print(f"\n✓ Using existing authentication")
     print(f"  Token expiry: {client.token_expiry}")
     
     # Simulate token near expiry
-    import time
     original_expiry = client.token_expiry
     client.token_expiry = time.time() + 30  # Expire in 30 seconds
     
@@ -108,33 +95,35 @@ def token_refresh_example():
     if system_info:
         print(f"\n✓ Token automatically refreshed")
         print(f"  New token expiry: {client.token_expiry}")
-    
-    client.logout()
 
 
-def error_handling_example():
+def error_handling_example(client: FMCClient):
     """Demonstrate error handling."""
     print("\n" + "=" * 60)
     print("Example 5: Error Handling")
     print("=" * 60)
     
-    with FMCClient() as client:
-        # Try to get non-existent object
-        result = client.get("object/networks/invalid-uuid")
-        
-        if result is None:
-            print("\n✓ Error handled gracefully")
-            print("  The client automatically logs errors and returns None")
+    # Try to get non-existent object
+    result = client.get("object/networks/invalid-uuid")
+    
+    if result is None:
+        print("\n✓ Error handled gracefully")
+        print("  The client automatically logs errors and returns None")
 
 
 def main():
     """Run all authentication examples."""
     try:
         basic_authentication()
-        context_manager_example()
-        get_domain_info()
-        token_refresh_example()
-        error_handling_example()
+        
+        # Remaining examples share one authenticated session
+        with FMCClient() as client:
+            context_manager_example(client)
+            get_domain_info(client)
+            token_refresh_example(client)
+            error_handling_example(client)
+        
+        print("\n✓ Automatically logged out")
         
         print("\n" + "=" * 60)
         print("All examples completed successfully!")
@@ -9,13 +9,18 @@ Demonstrates:
 - Bulk operations
 """
 
-import sys
-import os
+from lib.fmc_client import FMCClient
+from lib.utils import validate_ip_address, validate_ip_network, validate_ips_batch
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Endpoint paths; the "/"-terminated forms take an object ID by concatenation
+_HOSTS_EP = "object/hosts"
+_HOST_ID_EP = "object/hosts/"
+_NETWORKS_EP = "object/networks"
+_NETWORK_ID_EP = "object/networks/"
+_RANGES_EP = "object/ranges"
 
-from lib.fmc_client import FMCClient
-from lib.utils import validate_ip_address, validate_ip_network
+# FMC accepts at most this many objects in one bulk request
+_BULK_LIMIT = 1000
 
 
 class NetworkObjectManager:
@@ -23,6 +28,29 @@ class NetworkObjectManager:
     
     def __init__(self, client: FMCClient):
         self.client = client
+        # Name -> object indexes, built lazily with one paginated fetch
+        self._host_index = None
+        self._network_index = None
+    
+    def _hosts_index(self) -> dict:
+        """Get the name -> host object index, building it on first use."""
+        if self._host_index is None:
+            self._host_index = {h['name']: h for h in self.client.get_all_pages(_HOSTS_EP)}
+        return self._host_index
+    
+    def _networks_index(self) -> dict:
+        """Get the name -> network object index, building it on first use."""
+        if self._network_index is None:
+            self._network_index = {n['name']: n for n in self.client.get_all_pages(_NETWORKS_EP)}
+        return self._network_index
+    
+    def invalidate_host_index(self):
+        """Discard the cached host index after hosts change."""
+        self._host_index = None
+    
+    def invalidate_network_index(self):
+        """Discard the cached network index after networks change."""
+        self._network_index = None
     
     def create_host(self, name: str, ip_address: str, description: str = "") -> dict:
         """
@@ -47,7 +75,8 @@ class NetworkObjectManager:
         }
         
         self.client.logger.info(f"Creating host object: {name} ({ip_address})")
-        return self.client.post("object/hosts", data)
+        self.invalidate_host_index()
+        return self.client.post(_HOSTS_EP, data)
     
     def create_network(self, name: str, network: str, description: str = "") -> dict:
         """
@@ -72,7 +101,8 @@ class NetworkObjectManager:
         }
         
         self.client.logger.info(f"Creating network object: {name} ({network})")
-        return self.client.post("object/networks", data)
+        self.invalidate_network_index()
+        return self.client.post(_NETWORKS_EP, data)
     
     def create_range(self, name: str, start_ip: str, end_ip: str, description: str = "") -> dict:
         """
@@ -98,33 +128,100 @@ class NetworkObjectManager:
         }
         
         self.client.logger.info(f"Creating range object: {name} ({start_ip}-{end_ip})")
-        return self.client.post("object/ranges", data)
+        return self.client.post(_RANGES_EP, data)
+    
+    def _post_bulk(self, endpoint: str, payload: list) -> dict:
+        """
+        POST objects to a bulk endpoint, splitting at FMC's per-request limit.
+        
+        Args:
+            endpoint: Object endpoint (without query string)
+            payload: List of object dictionaries
+        
+        Returns:
+            Merged bulk response data (created objects under 'items')
+        """
+        return {"items": self.client.post_bulk(endpoint, payload, _BULK_LIMIT)}
+    
+    def create_hosts_bulk(self, entries: list) -> dict:
+        """
+        Create multiple host objects with bulk requests.
+        
+        Args:
+            entries: List of (name, ip_address, description) tuples.
+                Entries with an invalid IP address are skipped.
+        
+        Returns:
+            Bulk response data (created objects under 'items', empty
+            when no entry is valid)
+        """
+        valid = validate_ips_batch(ip for _, ip, _ in entries)
+        
+        for (name, ip_address, _), is_valid in zip(entries, valid):
+            if not is_valid:
+                self.client.logger.warning(f"Skipping {name}: invalid IP address {ip_address}")
+        
+        payload = [
+            {"name": name, "type": "Host", "value": ip_address, "description": description}
+            for (name, ip_address, description), is_valid in zip(entries, valid)
+            if is_valid
+        ]
+        
+        if not payload:
+            return {"items": []}
+        
+        self.client.logger.info(f"Bulk creating {len(payload)} host objects")
+        self.invalidate_host_index()
+        return self._post_bulk(_HOSTS_EP, payload)
+    
+    def create_networks_bulk(self, entries: list) -> dict:
+        """
+        Create multiple network objects with bulk requests.
+        
+        Args:
+            entries: List of (name, network, description) tuples.
+                Entries with an invalid network are skipped.
+        
+        Returns:
+            Bulk response data (created objects under 'items', empty
+            when no entry is valid)
+        """
+        valid = [validate_ip_network(network) for _, network, _ in entries]
+        
+        for (name, network, _), is_valid in zip(entries, valid):
+            if not is_valid:
+                self.client.logger.warning(f"Skipping {name}: invalid network {network}")
+        
+        payload = [
+            {"name": name, "type": "Network", "value": network, "description": description}
+            for (name, network, description), is_valid in zip(entries, valid)
+            if is_valid
+        ]
+        
+        if not payload:
+            return {"items": []}
+        
+        self.client.logger.info(f"Bulk creating {len(payload)} network objects")
+        self.invalidate_network_index()
+        return self._post_bulk(_NETWORKS_EP, payload)
     
     def get_all_hosts(self) -> list:
         """Get all host objects."""
         self.client.logger.info("Retrieving all host objects")
-        return self.client.get_all_pages("object/hosts")
+        return self.client.get_all_pages(_HOSTS_EP)
     
     def get_all_networks(self) -> list:
         """Get all network objects."""
         self.client.logger.info("Retrieving all network objects")
-        return self.client.get_all_pages("object/networks")
+        return self.client.get_all_pages(_NETWORKS_EP)
     
     def get_host_by_name(self, name: str) -> dict:
         """Get host object by name."""
-        hosts = self.client.get("object/hosts", params={"filter": f"name:{name}"})
-        
-        if hosts and hosts.get('items'):
-            return hosts['items'][0]
-        return None
+        return self._hosts_index().get(name)
     
     def get_network_by_name(self, name: str) -> dict:
         """Get network object by name."""
-        networks = self.client.get("object/networks", params={"filter": f"name:{name}"})
-        
-        if networks and networks.get('items'):
-            return networks['items'][0]
-        return None
+        return self._networks_index().get(name)
     
     def update_host(self, host_id: str, name: str, ip_address: str, description: str = "") -> dict:
         """Update existing host object."""
@@ -137,179 +234,215 @@ class NetworkObjectManager:
         }
         
         self.client.logger.info(f"Updating host object: {name}")
-        return self.client.put(f"object/hosts/{host_id}", data)
+        self.invalidate_host_index()
+        return self.client.put(_HOST_ID_EP + host_id, data)
     
     def delete_host(self, host_id: str) -> bool:
         """Delete host object."""
         self.client.logger.info(f"Deleting host object: {host_id}")
-        return self.client.delete(f"object/hosts/{host_id}")
+        self.invalidate_host_index()
+        return self.client.delete(_HOST_ID_EP + host_id)
     
     def delete_network(self, network_id: str) -> bool:
         """Delete network object."""
         self.client.logger.info(f"Deleting network object: {network_id}")
-        return self.client.delete(f"object/networks/{network_id}")
+        self.invalidate_network_index()
+        return self.client.delete(_NETWORK_ID_EP + network_id)
 
 
-def example_create_objects():
+def example_create_objects(client: FMCClient):
     """Create various network objects."""
     print("=" * 60)
     print("Example 1: Creating Network Objects")
     print("=" * 60)
     
-    with FMCClient() as client:
-        manager = NetworkObjectManager(client)
-        
-        # Create host objects
-        print("\n1. Creating host objects...")
-        hosts = [
-            ("Web_Server_1", "10.1.1.10", "Production web server"),
-            ("Database_Server", "10.1.2.20", "Main database server"),
-            ("DNS_Server", "10.1.3.30", "Internal DNS server")
-        ]
-        
-        for name, ip, desc in hosts:
-            result = manager.create_host(name, ip, desc)
-            if result:
-                print(f"  ✓ Created host: {name} ({ip})")
-            else:
-                print(f"  ✗ Failed to create: {name}")
-        
-        # Create network objects
-        print("\n2. Creating network objects...")
-        networks = [
-            ("DMZ_Network", "192.168.100.0/24", "DMZ zone"),
-            ("Internal_Network", "10.0.0.0/8", "Internal corporate network"),
-            ("Guest_WiFi", "172.16.50.0/24", "Guest wireless network")
-        ]
-        
-        for name, net, desc in networks:
-            result = manager.create_network(name, net, desc)
-            if result:
-                print(f"  ✓ Created network: {name} ({net})")
-            else:
-                print(f"  ✗ Failed to create: {name}")
-        
-        # Create range object
-        print("\n3. Creating IP range object...")
-        result = manager.create_range(
-            "DHCP_Pool",
-            "192.168.1.100",
-            "192.168.1.200",
-            "DHCP address pool"
-        )
+    manager = NetworkObjectManager(client)
+    
+    # Create host objects
+    print("\n1. Creating host objects...")
+    hosts = [
+        ("Web_Server_1", "10.1.1.10", "Production web server"),
+        ("Database_Server", "10.1.2.20", "Main database server"),
+        ("DNS_Server", "10.1.3.30", "Internal DNS server")
+    ]
+    
+    for name, ip, desc in hosts:
+        result = manager.create_host(name, ip, desc)
         if result:
-            print(f"  ✓ Created range: DHCP_Pool")
+            print(f"  ✓ Created host: {name} ({ip})")
+        else:
+            print(f"  ✗ Failed to create: {name}")
+    
+    # Create network objects
+    print("\n2. Creating network objects...")
+    networks = [
+        ("DMZ_Network", "192.168.100.0/24", "DMZ zone"),
+        ("Internal_Network", "10.0.0.0/8", "Internal corporate network"),
+        ("Guest_WiFi", "172.16.50.0/24", "Guest wireless network")
+    ]
+    
+    for name, net, desc in networks:
+        result = manager.create_network(name, net, desc)
+        if result:
+            print(f"  ✓ Created network: {name} ({net})")
+        else:
+            print(f"  ✗ Failed to create: {name}")
+    
+    # Create range object
+    print("\n3. Creating IP range object...")
+    result = manager.create_range(
+        "DHCP_Pool",
+        "192.168.1.100",
+        "192.168.1.200",
+        "DHCP address pool"
+    )
+    if result:
+        print(f"  ✓ Created range: DHCP_Pool")
 
 
-def example_retrieve_objects():
+def example_retrieve_objects(client: FMCClient):
     """Retrieve and display network objects."""
     print("\n" + "=" * 60)
     print("Example 2: Retrieving Network Objects")
     print("=" * 60)
     
-    with FMCClient() as client:
-        manager = NetworkObjectManager(client)
-        
-        # Get all hosts
-        print("\n1. Retrieving all host objects...")
-        hosts = manager.get_all_hosts()
-        print(f"  Found {len(hosts)} host objects:")
-        for host in hosts[:5]:  # Show first 5
-            print(f"    - {host.get('name')}: {host.get('value')}")
-        
-        # Get specific object by name
-        print("\n2. Retrieving specific host by name...")
-        host = manager.get_host_by_name("Web_Server_1")
-        if host:
-            print(f"  ✓ Found: {host.get('name')}")
-            print(f"    ID: {host.get('id')}")
-            print(f"    Value: {host.get('value')}")
-            print(f"    Description: {host.get('description')}")
+    manager = NetworkObjectManager(client)
+    
+    # Stream hosts and stop after the first 5 (later pages are never fetched)
+    print("\n1. Retrieving host objects...")
+    print("  First 5 host objects:")
+    for idx, host in enumerate(client.iter_pages("object/hosts")):
+        if idx >= 5:
+            break
+        print(f"    - {host.get('name')}: {host.get('value')}")
+    
+    # Get specific object by name
+    print("\n2. Retrieving specific host by name...")
+    host = manager.get_host_by_name("Web_Server_1")
+    if host:
+        print(f"  ✓ Found: {host.get('name')}")
+        print(f"    ID: {host.get('id')}")
+        print(f"    Value: {host.get('value')}")
+        print(f"    Description: {host.get('description')}")
 
 
-def example_update_objects():
+def example_update_objects(client: FMCClient):
     """Update existing network objects."""
     print("\n" + "=" * 60)
     print("Example 3: Updating Network Objects")
     print("=" * 60)
     
-    with FMCClient() as client:
-        manager = NetworkObjectManager(client)
-        
-        # Find object to update
-        print("\n1. Finding object to update...")
-        host = manager.get_host_by_name("Web_Server_1")
-        
-        if host:
-            print(f"  ✓ Found: {host.get('name')}")
-            
-            # Update the object
-            print("\n2. Updating object...")
-            updated = manager.update_host(
-                host.get('id'),
-                "Web_Server_1",
-                "10.1.1.15",  # New IP
-                "Production web server - Updated IP"
-            )
-            
-            if updated:
-                print(f"  ✓ Updated successfully")
-                print(f"    New IP: {updated.get('value')}")
+    manager = NetworkObjectManager(client)
+    
+    # Find object to update
+    print("\n1. Finding object to update...")
+    host = manager.get_host_by_name("Web_Server_1")
+    
+    if host:
+        print(f"  ✓ Found: {host.get('name')}")
+        
+        # Update the object
+        print("\n2. Updating object...")
+        updated = manager.update_host(
+            host.get('id'),
+            "Web_Server_1",
+            "10.1.1.15",  # New IP
+            "Production web server - Updated IP"
+        )
+        
+        if updated:
+            print(f"  ✓ Updated successfully")
+            print(f"    New IP: {updated.get('value')}")
 
 
-def example_delete_objects():
+def example_delete_objects(client: FMCClient):
     """Delete network objects."""
     print("\n" + "=" * 60)
     print("Example 4: Deleting Network Objects")
     print("=" * 60)
     
-    with FMCClient() as client:
-        manager = NetworkObjectManager(client)
-        
-        # Find and delete object
-        print("\n1. Finding object to delete...")
-        host = manager.get_host_by_name("DNS_Server")
-        
-        if host:
-            print(f"  ✓ Found: {host.get('name')}")
-            
-            print("\n2. Deleting object...")
-            if manager.delete_host(host.get('id')):
-                print(f"  ✓ Deleted successfully")
-            else:
-                print(f"  ✗ Deletion failed")
+    manager = NetworkObjectManager(client)
+    
+    # Find and delete object
+    print("\n1. Finding object to delete...")
+    host = manager.get_host_by_name("DNS_Server")
+    
+    if host:
+        print(f"  ✓ Found: {host.get('name')}")
+        
+        print("\n2. Deleting object...")
+        if manager.delete_host(host.get('id')):
+            print(f"  ✓ Deleted successfully")
+        else:
+            print(f"  ✗ Deletion failed")
 
 
-def example_bulk_create():
+def example_bulk_create(client: FMCClient):
     """Bulk create network objects from list."""
     print("\n" + "=" * 60)
     print("Example 5: Bulk Object Creation")
     print("=" * 60)
     
-    with FMCClient() as client:
-        manager = NetworkObjectManager(client)
-        
-        # List of servers to create
-        servers = [
-            ("App_Server_1", "10.2.1.10"),
-            ("App_Server_2", "10.2.1.11"),
-            ("App_Server_3", "10.2.1.12"),
-            ("App_Server_4", "10.2.1.13"),
-            ("App_Server_5", "10.2.1.14")
-        ]
-        
-        print(f"\nCreating {len(servers)} host objects...")
-        success_count = 0
-        
-        for name, ip in servers:
-            result = manager.create_host(name, ip, f"Application server {name}")
-            if result:
-                success_count += 1
-                print(f"  ✓ {name}")
-            else:
-                print(f"  ✗ {name}")
-        
-        print(f"\n✓ Created {success_count}/{len(servers)} objects")
+    manager = NetworkObjectManager(client)
+    
+    # List of servers to create
+    servers = [
+        ("App_Server_1", "10.2.1.10"),
+        ("App_Server_2", "10.2.1.11"),
+        ("App_Server_3", "10.2.1.12"),
+        ("App_Server_4", "10.2.1.13"),
+        ("App_Server_5", "10.2.1.14")
+    ]
+    
+    print(f"\nCreating {len(servers)} host objects...")
+    
+    # One bulk request instead of one POST per server
+    result = manager.create_hosts_bulk(
+        [(name, ip, f"Application server {name}") for name, ip in servers]
+    )
+    created = result.get('items', []) if result else []
+    
+    for host in created:
+        print(f"  ✓ {host.get('name')}")
+    
+    print(f"\n✓ Created {len(created)}/{len(servers)} objects")
+
+
+def example_async_bulk_create():
+    """Create host objects concurrently with the async client."""
+    print("\n" + "=" * 60)
+    print("Example 6: Concurrent Object Creation (async)")
+    print("=" * 60)
+    
+    # Only needed by this example; httpx is optional: pip install "httpx[http2]"
+    import asyncio
+    from lib.fmc_client_async import AsyncFMCClient
+    
+    payloads = [
+        {
+            "name": f"Async_Server_{i}",
+            "type": "Host",
+            "value": f"10.3.1.{i}",
+            "description": f"Application server Async_Server_{i}"
+        }
+        for i in range(1, 6)
+    ]
+    
+    async def amain():
+        async with AsyncFMCClient() as client:
+            return await client.gather(
+                *[client.post("object/hosts", host) for host in payloads]
+            )
+    
+    print(f"\nCreating {len(payloads)} host objects concurrently...")
+    results = asyncio.run(amain())
+    
+    for host, result in zip(payloads, results):
+        mark = "✓" if result else "✗"
+        print(f"  {mark} {host['name']}")
+    
+    success_count = sum(1 for result in results if result)
+    print(f"\n✓ Created {success_count}/{len(payloads)} objects")
 
 
 def main():
@@ -321,11 +454,15 @@ def main():
         print("\n⚠ WARNING: These examples will create objects in your FMC")
         print("Make sure you're connected to a test/lab environment\n")
         
-        example_create_objects()
-        example_retrieve_objects()
-        # example_update_objects()  # Uncomment to test updates
-        # example_delete_objects()   # Uncomment to test deletion
-        # example_bulk_create()      # Uncomment for bulk creation
+        # One authenticated session is shared by all examples
+        with FMCClient() as client:
+            example_create_objects(client)
+            example_retrieve_objects(client)
+            # example_update_objects(client)  # Uncomment to test updates
+            # example_delete_objects(client)   # Uncomment to test deletion
+            # example_bulk_create(client)      # Uncomment for bulk creation
+        
+        # example_async_bulk_create()  # Uncomment for async creation (needs httpx)
         
         print("\n" + "=" * 60)
         print("Network object examples completed!")
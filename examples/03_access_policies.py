@@ -10,12 +10,22 @@ Demonstrates:
 """
 
 import sys
-import os
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from lib.fmc_client import FMCClient
-from typing import List, Dict, Optional
+from typing import Iterator, List, Optional, Union
+
+# FMC accepts at most this many rules in one bulk request
+_BULK_LIMIT = 1000
+
+# Streamed listings write their output after this many entries
+_WRITE_EVERY = 100
+
+_POLICIES_EP = "policy/accesspolicies"
+_RULES_EP = "policy/accesspolicies/{}/accessrules"
+
+# Fixed part of each rule payload; builders copy it and fill in the rest
+_ALLOW_TEMPLATE = {"type": "AccessRule", "action": "ALLOW"}
+_BLOCK_TEMPLATE = {"type": "AccessRule", "action": "BLOCK"}
 
 
 class AccessPolicyManager:
@@ -46,44 +56,59 @@ class AccessPolicyManager:
             "description": description
         }
         
-        self.client.logger.info(f"Creating access policy: {name}")
-        return self.client.post("policy/accesspolicies", data)
+        self.client.logger.info("Creating access policy: %s", name)
+        self.client.invalidate_name_cache()
+        return self.client.post(_POLICIES_EP, data)
     
     def get_all_policies(self) -> List[dict]:
         """Get all access control policies."""
         self.client.logger.info("Retrieving all access policies")
-        return self.client.get_all_pages("policy/accesspolicies")
+        return self.client.get_all_pages(_POLICIES_EP)
     
     def get_policy_by_name(self, name: str) -> Optional[dict]:
         """Get policy by name."""
-        policies = self.client.get("policy/accesspolicies", 
-                                  params={"filter": f"name:{name}"})
-        
-        if policies and policies.get('items'):
-            return policies['items'][0]
-        return None
+        return self.client.get_by_name(_POLICIES_EP, name)
     
-    def create_access_rule(self, policy_id: str, rule_data: dict) -> dict:
+    def create_access_rule(self, policy_id: str,
+                           rule_data: Union[dict, List[dict]]) -> Union[dict, List[dict]]:
         """
-        Create an access rule in a policy.
+        Create one access rule, or several with bulk requests, in a policy.
+        
+        A single rule is sent with a plain POST; only a list goes to the
+        bulk endpoint, in chunks of at most _BULK_LIMIT rules.
         
         Args:
             policy_id: Parent policy UUID
-            rule_data: Rule configuration
+            rule_data: Rule configuration, or list of rule configurations
         
         Returns:
-            Created rule data
+            Created rule data, or list of created rule data for a list
         """
-        endpoint = f"policy/accesspolicies/{policy_id}/accessrules"
-        self.client.logger.info(f"Creating access rule in policy {policy_id}")
-        return self.client.post(endpoint, rule_data)
+        endpoint = _RULES_EP.format(policy_id)
+        self.client.invalidate_name_cache()
+        
+        if isinstance(rule_data, dict):
+            self.client.logger.info("Creating access rule in policy %s", policy_id)
+            return self.client.post(endpoint, rule_data)
+        
+        self.client.logger.info("Creating %d access rules in policy %s", len(rule_data), policy_id)
+        return self.client.post_bulk(endpoint, rule_data, _BULK_LIMIT)
+    
+    def create_access_rules_bulk(self, policy_id: str, rules: List[dict]) -> List[dict]:
+        """Create multiple access rules in a policy; see create_access_rule."""
+        return self.create_access_rule(policy_id, rules)
     
     def get_policy_rules(self, policy_id: str) -> List[dict]:
         """Get all rules in a policy."""
-        endpoint = f"policy/accesspolicies/{policy_id}/accessrules"
-        self.client.logger.info(f"Retrieving rules for policy {policy_id}")
+        endpoint = _RULES_EP.format(policy_id)
+        self.client.logger.debug("Retrieving rules for policy %s", policy_id)
         return self.client.get_all_pages(endpoint)
     
+    def iter_policy_rules(self, policy_id: str) -> Iterator[dict]:
+        """Iterate over the rules in a policy, one page in memory at a time."""
+        endpoint = _RULES_EP.format(policy_id)
+        return self.client.iter_pages(endpoint)
+    
     def build_allow_rule(self, name: str, source_networks: List[dict],
                         dest_networks: List[dict], source_ports: List[dict] = None,
                         dest_ports: List[dict] = None, enabled: bool = True) -> dict:
@@ -101,18 +126,11 @@ class AccessPolicyManager:
         Returns:
             Rule configuration dictionary
         """
-        rule = {
-            "name": name,
-            "type": "AccessRule",
-            "action": "ALLOW",
-            "enabled": enabled,
-            "sourceNetworks": {
-                "objects": source_networks
-            },
-            "destinationNetworks": {
-                "objects": dest_networks
-            }
-        }
+        rule = _ALLOW_TEMPLATE.copy()
+        rule["name"] = name
+        rule["enabled"] = enabled
+        rule["sourceNetworks"] = {"objects": source_networks}
+        rule["destinationNetworks"] = {"objects": dest_networks}
         
         if source_ports:
             rule["sourcePorts"] = {"objects": source_ports}
@@ -125,18 +143,12 @@ class AccessPolicyManager:
     def build_block_rule(self, name: str, source_networks: List[dict],
                         dest_networks: List[dict], enabled: bool = True) -> dict:
         """Build a BLOCK access rule configuration."""
-        return {
-            "name": name,
-            "type": "AccessRule",
-            "action": "BLOCK",
-            "enabled": enabled,
-            "sourceNetworks": {
-                "objects": source_networks
-            },
-            "destinationNetworks": {
-                "objects": dest_networks
-            }
-        }
+        rule = _BLOCK_TEMPLATE.copy()
+        rule["name"] = name
+        rule["enabled"] = enabled
+        rule["sourceNetworks"] = {"objects": source_networks}
+        rule["destinationNetworks"] = {"objects": dest_networks}
+        return rule
 
 
 def example_create_policy():
@@ -145,7 +157,7 @@ def example_create_policy():
     print("Example 1: Creating Access Control Policy")
     print("=" * 60)
     
-    with FMCClient() as client:
+    with FMCClient.get_shared() as client:
         manager = AccessPolicyManager(client)
         
         print("\n1. Creating new access policy...")
@@ -170,18 +182,22 @@ def example_list_policies():
     print("Example 2: Listing Access Control Policies")
     print("=" * 60)
     
-    with FMCClient() as client:
+    with FMCClient.get_shared() as client:
         manager = AccessPolicyManager(client)
         
         print("\nRetrieving all policies...")
         policies = manager.get_all_policies()
         
-        print(f"\nFound {len(policies)} policies:")
+        # One write for the whole listing instead of four prints per policy
+        buf = [f"\nFound {len(policies)} policies:\n"]
         for policy in policies:
-            print(f"\n  • {policy.get('name')}")
-            print(f"    ID: {policy.get('id')}")
-            print(f"    Type: {policy.get('type')}")
-            print(f"    Default Action: {policy.get('defaultAction', {}).get('action')}")
+            buf.append(
+                f"\n  • {policy.get('name')}\n"
+                f"    ID: {policy.get('id')}\n"
+                f"    Type: {policy.get('type')}\n"
+                f"    Default Action: {policy.get('defaultAction', {}).get('action')}\n"
+            )
+        sys.stdout.write(''.join(buf))
 
 
 def example_create_rules():
@@ -190,7 +206,7 @@ def example_create_rules():
     print("Example 3: Creating Access Rules")
     print("=" * 60)
     
-    with FMCClient() as client:
+    with FMCClient.get_shared() as client:
         manager = AccessPolicyManager(client)
         
         # Find the policy
@@ -210,8 +226,8 @@ def example_create_rules():
         # For this example, we'll use "any" objects
         # In practice, you'd retrieve specific network objects
         
-        # Create a simple allow rule
-        print("\n3. Creating ALLOW rule for web traffic...")
+        # Build both rules, then create them with one bulk request
+        print("\n3. Preparing ALLOW rule for web traffic...")
         
         rule_data = {
             "name": "Allow_Web_Traffic",
@@ -223,15 +239,7 @@ def example_create_rules():
             "logEnd": True
         }
         
-        rule = manager.create_access_rule(policy_id, rule_data)
-        
-        if rule:
-            print(f"  ✓ Rule created successfully")
-            print(f"    Name: {rule.get('name')}")
-            print(f"    Action: {rule.get('action')}")
-        
-        # Create a block rule
-        print("\n4. Creating BLOCK rule for suspicious traffic...")
+        print("\n4. Preparing BLOCK rule for suspicious traffic...")
         
         block_rule_data = {
             "name": "Block_Suspicious_Traffic",
@@ -243,11 +251,16 @@ def example_create_rules():
             "logEnd": True
         }
         
-        block_rule = manager.create_access_rule(policy_id, block_rule_data)
+        print("\n5. Creating rules...")
+        created = manager.create_access_rule(policy_id, [rule_data, block_rule_data])
+        
+        for rule in created:
+            print(f"  ✓ Rule created successfully")
+            print(f"    Name: {rule.get('name')}")
+            print(f"    Action: {rule.get('action')}")
         
-        if block_rule:
-            print(f"  ✓ Block rule created successfully")
-            print(f"    Name: {block_rule.get('name')}")
+        if len(created) < 2:
+            print(f"  ✗ {2 - len(created)} rule(s) failed to create")
 
 
 def example_list_rules():
@@ -256,7 +269,7 @@ def example_list_rules():
     print("Example 4: Listing Policy Rules")
     print("=" * 60)
     
-    with FMCClient() as client:
+    with FMCClient.get_shared() as client:
         manager = AccessPolicyManager(client)
         
         # Find the policy
@@ -271,14 +284,24 @@ def example_list_rules():
         
         # Get all rules
         print("\n2. Retrieving all rules...")
-        rules = manager.get_policy_rules(policy.get('id'))
-        
-        print(f"\nFound {len(rules)} rules:")
-        for idx, rule in enumerate(rules, 1):
-            print(f"\n  {idx}. {rule.get('name')}")
-            print(f"     Action: {rule.get('action')}")
-            print(f"     Enabled: {rule.get('enabled')}")
-            print(f"     ID: {rule.get('id')}")
+        count = 0
+        
+        # Rules are written in batches as pages arrive instead of collected first
+        buf = []
+        for idx, rule in enumerate(manager.iter_policy_rules(policy.get('id')), 1):
+            buf.append(
+                f"\n  {idx}. {rule.get('name')}\n"
+                f"     Action: {rule.get('action')}\n"
+                f"     Enabled: {rule.get('enabled')}\n"
+                f"     ID: {rule.get('id')}\n"
+            )
+            count = idx
+            if len(buf) >= _WRITE_EVERY:
+                sys.stdout.write(''.join(buf))
+                buf.clear()
+        sys.stdout.write(''.join(buf))
+        
+        print(f"\nFound {count} rules")
 
 
 def example_complex_rule_with_objects():
@@ -287,7 +310,7 @@ def example_complex_rule_with_objects():
     print("Example 5: Complex Rule with Objects")
     print("=" * 60)
     
-    with FMCClient() as client:
+    with FMCClient.get_shared() as client:
         manager = AccessPolicyManager(client)
         
         print("\n1. Finding policy...")
@@ -339,11 +362,13 @@ def main():
         print("\n⚠ WARNING: These examples will create policies in your FMC")
         print("Make sure you're connected to a test/lab environment\n")
         
-        example_create_policy()
-        example_list_policies()
-        example_create_rules()
-        example_list_rules()
-        example_complex_rule_with_objects()
+        # Hold the shared client open so every example reuses one session
+        with FMCClient.get_shared():
+            example_create_policy()
+            example_list_policies()
+            example_create_rules()
+            example_list_rules()
+            example_complex_rule_with_objects()
         
         print("\n" + "=" * 60)
         print("Access policy examples completed!")
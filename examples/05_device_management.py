@@ -10,13 +10,23 @@ Demonstrates:
 """
 
 import sys
-import os
+import random
 import time
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from lib.fmc_client import FMCClient
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
+
+# Streamed listings write their output after this many entries
+_WRITE_EVERY = 100
+
+_DEVICES_EP = "devices/devicerecords"
+_DEVICE_ID_EP = "devices/devicerecords/"
+_DEPLOYMENTS_EP = "deployment/deploymentrequests"
+_DEPLOYMENT_ID_EP = "deployment/deploymentrequests/"
+
+# Shared read-only stand-in for missing nested dicts in API responses
+_EMPTY = {}
 
 
 class DeviceManager:
@@ -25,24 +35,39 @@ class DeviceManager:
     def __init__(self, client: FMCClient):
         self.client = client
     
-    def get_all_devices(self) -> List[dict]:
-        """Get all managed devices."""
+    def get_all_devices(self, expanded: Optional[bool] = None,
+                        fields: Optional[List[str]] = None) -> List[dict]:
+        """
+        Get all managed devices.
+        
+        Args:
+            expanded: Request full (True) or summary (False) device records;
+                None leaves the choice to FMC
+            fields: Restrict records to these attributes, where FMC supports it
+        
+        Returns:
+            List of device records
+        """
         self.client.logger.info("Retrieving all devices")
-        return self.client.get_all_pages("devices/devicerecords")
+        params = {}
+        if expanded is not None:
+            params['expanded'] = 'true' if expanded else 'false'
+        if fields:
+            params['fields'] = ','.join(fields)
+        return self.client.get_all_pages(_DEVICES_EP, params)
+    
+    def iter_devices(self) -> Iterator[dict]:
+        """Iterate over managed devices, one page in memory at a time."""
+        return self.client.iter_pages(_DEVICES_EP)
     
     def get_device_by_name(self, name: str) -> Optional[dict]:
         """Get device by name."""
-        devices = self.client.get("devices/devicerecords",
-                                 params={"filter": f"name:{name}"})
-        
-        if devices and devices.get('items'):
-            return devices['items'][0]
-        return None
+        return self.client.get_by_name(_DEVICES_EP, name)
     
     def get_device_details(self, device_id: str) -> Optional[dict]:
         """Get detailed device information."""
-        self.client.logger.info(f"Retrieving details for device {device_id}")
-        return self.client.get(f"devices/devicerecords/{device_id}")
+        self.client.logger.debug("Retrieving details for device %s", device_id)
+        return self.client.get(_DEVICE_ID_EP + device_id)
     
     def deploy_to_device(self, device_id: str, force_deploy: bool = False,
                         ignore_warning: bool = True) -> Optional[dict]:
@@ -59,50 +84,56 @@ class DeviceManager:
         """
         data = {
             "type": "DeploymentRequest",
-            "version": int(time.time()),
+            "version": self.client.next_deploy_version(),
             "forceDeploy": force_deploy,
             "ignoreWarning": ignore_warning,
             "deviceList": [device_id]
         }
         
-        self.client.logger.info(f"Initiating deployment to device {device_id}")
-        return self.client.post("deployment/deploymentrequests", data)
+        self.client.logger.info("Initiating deployment to device %s", device_id)
+        return self.client.post(_DEPLOYMENTS_EP, data)
     
     def get_deployment_status(self, deployment_id: str) -> Optional[dict]:
-        """Get deployment job status."""
-        self.client.logger.info(f"Checking deployment status for {deployment_id}")
-        return self.client.get(f"deployment/deploymentrequests/{deployment_id}")
+        """Get deployment job status (conditional GET; unchanged status costs no body)."""
+        self.client.logger.debug("Checking deployment status for %s", deployment_id)
+        return self.client.get(_DEPLOYMENT_ID_EP + deployment_id,
+                               conditional=True)
     
     def get_pending_deployments(self) -> List[dict]:
         """Get all devices with pending deployments."""
         self.client.logger.info("Checking for pending deployments")
         
-        devices = self.get_all_devices()
-        pending = []
+        # Only the deployment status is needed, so skip the full records
+        devices = self.get_all_devices(expanded=False, fields=['name', 'id', 'metadata'])
         
-        for device in devices:
-            metadata = device.get('metadata', {})
-            if metadata.get('deploymentStatus') == 'PENDING':
-                pending.append(device)
-        
-        return pending
+        return [
+            device for device in devices
+            if (device.get('metadata') or _EMPTY).get('deploymentStatus') == 'PENDING'
+        ]
     
     def wait_for_deployment(self, deployment_id: str, timeout: int = 300,
-                          poll_interval: int = 10) -> bool:
+                          poll_interval: float = 1, max_interval: float = 30) -> bool:
         """
         Wait for deployment to complete.
         
+        Polls with exponential backoff: the interval grows from poll_interval
+        up to max_interval while the state is unchanged, and resets to
+        poll_interval whenever the state changes.
+        
         Args:
             deployment_id: Deployment job UUID
             timeout: Maximum wait time in seconds
-            poll_interval: Time between status checks
+            poll_interval: Initial time between status checks
+            max_interval: Upper bound for the time between status checks
         
         Returns:
             True if deployment succeeded, False otherwise
         """
-        elapsed = 0
+        deadline = time.monotonic() + timeout
+        interval = poll_interval
+        last_state = None
         
-        while elapsed < timeout:
+        while time.monotonic() < deadline:
             status = self.get_deployment_status(deployment_id)
             
             if not status:
@@ -115,15 +146,122 @@ class DeviceManager:
                 self.client.logger.info("Deployment completed successfully")
                 return True
             elif deploy_state in ['FAILED', 'ABORTED']:
-                self.client.logger.error(f"Deployment {deploy_state.lower()}")
+                self.client.logger.error("Deployment %s", deploy_state.lower())
                 return False
             
-            self.client.logger.info(f"Deployment in progress... ({deploy_state})")
-            time.sleep(poll_interval)
-            elapsed += poll_interval
+            if deploy_state != last_state:
+                interval = poll_interval
+                last_state = deploy_state
+            
+            self.client.logger.debug("Deployment in progress... (%s)", deploy_state)
+            
+            # Jitter keeps concurrent waiters from polling in lockstep
+            sleep_for = interval * random.uniform(0.8, 1.2)
+            time.sleep(min(sleep_for, max(0, deadline - time.monotonic())))
+            interval = min(max_interval, interval * 1.8)
         
         self.client.logger.warning("Deployment timeout reached")
         return False
+    
+    def wait_for_deployments(self, deployment_ids: List[str], timeout: int = 600,
+                             poll_interval: float = 5) -> Dict[str, bool]:
+        """
+        Wait for several deployments with one status query per polling round.
+        
+        Each round lists the states of all unfinished deployments in a single
+        request; deployments are dropped from the query as they finish.
+        
+        Args:
+            deployment_ids: Deployment job UUIDs
+            timeout: Maximum wait time in seconds for all deployments
+            poll_interval: Time between polling rounds
+        
+        Returns:
+            Dictionary mapping deployment ID to True if it succeeded
+        """
+        results = {deployment_id: False for deployment_id in deployment_ids}
+        remaining = set(deployment_ids)
+        deadline = time.monotonic() + timeout
+        
+        while remaining and time.monotonic() < deadline:
+            page = self.client.get(_DEPLOYMENTS_EP, params={
+                'filter': 'ids:' + ','.join(remaining),
+                'expanded': 'false',
+                'fields': 'id,deploymentState'
+            })
+            
+            for item in (page or _EMPTY).get('items', ()):
+                deployment_id = item.get('id')
+                if deployment_id not in remaining:
+                    continue
+                
+                deploy_state = item.get('deploymentState')
+                if deploy_state == 'DEPLOYED':
+                    results[deployment_id] = True
+                    remaining.discard(deployment_id)
+                elif deploy_state in ['FAILED', 'ABORTED']:
+                    self.client.logger.error("Deployment %s %s", deployment_id, deploy_state.lower())
+                    remaining.discard(deployment_id)
+            
+            if remaining:
+                time.sleep(min(poll_interval, max(0, deadline - time.monotonic())))
+        
+        if remaining:
+            self.client.logger.warning("Deployment timeout reached for %d deployments", len(remaining))
+        
+        return results
+    
+    def deploy_many(self, device_ids: List[str], timeout: int = 600,
+                    poll_interval: float = 5, max_workers: int = 8) -> Dict[str, bool]:
+        """
+        Deploy to several devices concurrently and wait for all of them.
+        
+        All deployment requests are submitted up front and then tracked
+        together by wait_for_deployments(), so total wait is bounded by the
+        slowest device.
+        
+        Args:
+            device_ids: Device UUIDs to deploy to
+            timeout: Maximum wait time in seconds for all deployments
+            poll_interval: Time between polling rounds
+            max_workers: Maximum concurrent deployment submissions
+        
+        Returns:
+            Dictionary mapping device ID to True if its deployment succeeded
+        """
+        self.client.logger.info("Deploying to %d devices", len(device_ids))
+        results = {device_id: False for device_id in device_ids}
+        
+        # A failed submission only loses its own device; the others are still tracked
+        jobs = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.deploy_to_device, device_id): device_id
+                for device_id in device_ids
+            }
+            
+            for future in as_completed(futures):
+                device_id = futures[future]
+                try:
+                    jobs[device_id] = future.result()
+                except Exception as e:
+                    jobs[device_id] = None
+                    self.client.logger.error("Deployment request for device %s raised: %s", device_id, e)
+        
+        # deployment ID -> device ID for every accepted request
+        in_flight = {
+            job['id']: device_id
+            for device_id, job in jobs.items()
+            if job and job.get('id')
+        }
+        
+        outcomes = self.wait_for_deployments(list(in_flight), timeout, poll_interval)
+        for deployment_id, ok in outcomes.items():
+            results[in_flight[deployment_id]] = ok
+        
+        self.client.logger.info("%d of %d deployments succeeded",
+                                sum(results.values()), len(results))
+        return results
 
 
 def example_list_devices():
@@ -136,20 +274,26 @@ def example_list_devices():
         manager = DeviceManager(client)
         
         print("\nRetrieving all devices...")
-        devices = manager.get_all_devices()
-        
-        print(f"\nFound {len(devices)} managed devices:")
-        for device in devices:
-            print(f"\n  • {device.get('name')}")
-            print(f"    Type: {device.get('type')}")
-            print(f"    Model: {device.get('model')}")
-            print(f"    IP: {device.get('hostName')}")
-            print(f"    SW Version: {device.get('sw_version', 'N/A')}")
-            
-            # Deployment status
-            metadata = device.get('metadata', {})
-            deploy_status = metadata.get('deploymentStatus', 'UNKNOWN')
-            print(f"    Deployment Status: {deploy_status}")
+        count = 0
+        
+        # Devices are written in batches as pages arrive instead of collected first
+        buf = []
+        for count, device in enumerate(manager.iter_devices(), 1):
+            metadata = device.get('metadata') or _EMPTY
+            buf.append(
+                f"\n  • {device.get('name')}\n"
+                f"    Type: {device.get('type')}\n"
+                f"    Model: {device.get('model')}\n"
+                f"    IP: {device.get('hostName')}\n"
+                f"    SW Version: {device.get('sw_version', 'N/A')}\n"
+                f"    Deployment Status: {metadata.get('deploymentStatus', 'UNKNOWN')}\n"
+            )
+            if len(buf) >= _WRITE_EVERY:
+                sys.stdout.write(''.join(buf))
+                buf.clear()
+        sys.stdout.write(''.join(buf))
+        
+        print(f"\nFound {count} managed devices")
 
 
 def example_device_details():
@@ -205,12 +349,14 @@ def example_check_pending_deployments():
         pending = manager.get_pending_deployments()
         
         if pending:
-            print(f"\nFound {len(pending)} devices with pending changes:")
+            buf = [f"\nFound {len(pending)} devices with pending changes:\n"]
             for device in pending:
-                print(f"\n  • {device.get('name')}")
-                print(f"    ID: {device.get('id')}")
-                metadata = device.get('metadata', {})
-                print(f"    Status: {metadata.get('deploymentStatus')}")
+                buf.append(
+                    f"\n  • {device.get('name')}\n"
+                    f"    ID: {device.get('id')}\n"
+                    f"    Status: {device['metadata'].get('deploymentStatus')}\n"
+                )
+            sys.stdout.write(''.join(buf))
         else:
             print("\n  ✓ No pending deployments")
 
@@ -278,23 +424,21 @@ def example_bulk_deployment():
         
         print(f"\n2. Found {len(pending)} devices with pending changes")
         
-        # In practice, you might deploy to all at once or in batches
+        # Submit all deployments at once, then monitor them together
         print("\n3. Deployment strategy:")
-        print("   • Deploy to devices one by one")
-        print("   • Monitor each deployment")
+        print("   • Submit deployments to all devices concurrently")
+        print("   • Monitor all deployments together")
         print("   • Handle failures gracefully")
         
         # Example structure (commented for safety):
-        # for device in pending:
-        #     print(f"\n   Deploying to: {device.get('name')}")
-        #     deployment = manager.deploy_to_device(device.get('id'))
-        #     
-        #     if deployment:
-        #         success = manager.wait_for_deployment(deployment.get('id'))
-        #         if success:
-        #             print(f"     ✓ Success")
-        #         else:
-        #             print(f"     ✗ Failed")
+        # names = {device.get('id'): device.get('name') for device in pending}
+        # results = manager.deploy_many(list(names))
+        # 
+        # for device_id, success in results.items():
+        #     if success:
+        #         print(f"     ✓ {names[device_id]}")
+        #     else:
+        #         print(f"     ✗ {names[device_id]}")
         
         print("\n  (Deployment code commented out for safety)")
 
@@ -9,25 +9,39 @@ Demonstrates:
 - Automated reporting
 """
 
-import sys
-import os
 import csv
-from typing import List, Dict, Tuple
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional, Tuple
 
 from lib.fmc_client import FMCClient
-from lib.utils import chunk_list, validate_ip_address, validate_ip_network
+from lib.utils import chunk_list, validate_ip_address, validate_ip_network, validate_ips_batch
+
+# CSV object type -> (validator, endpoint, failure reason)
+_CSV_TYPES = {
+    'Host': (validate_ip_address, "object/hosts", "Invalid IP"),
+    'Network': (validate_ip_network, "object/networks", "Invalid network"),
+}
 
 
 class BulkOperationsManager:
     """Manager for bulk operations in FMC."""
     
-    def __init__(self, client: FMCClient):
+    def __init__(self, client: FMCClient, use_bulk: bool = True):
+        """
+        Args:
+            client: Authenticated FMC client
+            use_bulk: Create objects through FMC's '?bulk=true' endpoints;
+                set False for servers without bulk support
+        """
         self.client = client
+        self.use_bulk = use_bulk
         self.success_count = 0
         self.failure_count = 0
         self.failures = []
+        # Guards the counters when requests complete on worker threads
+        self._lock = threading.Lock()
     
     def reset_counters(self):
         """Reset success/failure counters."""
@@ -35,6 +49,72 @@ class BulkOperationsManager:
         self.failure_count = 0
         self.failures = []
     
+    def _post_bulk(self, endpoint: str, payloads: List[dict]):
+        """
+        Create objects with bulk requests and record per-object outcomes.
+        
+        Objects missing from the response (their request failed) are
+        counted as failures.
+        """
+        if not payloads:
+            return
+        
+        if self.use_bulk:
+            results = self.client.post_bulk(endpoint, payloads)
+        else:
+            results = [obj for obj in self.client.post_many(endpoint, payloads) if obj]
+        
+        created = {obj.get('name') for obj in results}
+        
+        for data in payloads:
+            name = data["name"]
+            if name in created:
+                self.success_count += 1
+                self.client.logger.debug("✓ Created: %s", name)
+            else:
+                self.failure_count += 1
+                self.failures.append((name, "API request failed"))
+                self.client.logger.error("✗ Failed: %s", name)
+    
+    def _summary(self, total: Optional[int] = None) -> dict:
+        """Log one line with the outcome counts and build the summary dict."""
+        self.client.logger.info("Bulk operation finished: %d created, %d failed",
+                                self.success_count, self.failure_count)
+        summary = {
+            "success": self.success_count,
+            "failed": self.failure_count,
+            "failures": self.failures
+        }
+        if total is not None:
+            summary = {"total": total, **summary}
+        return summary
+    
+    def _host_payloads(self, host_list: List[Tuple[str, str, str]]) -> List[dict]:
+        """
+        Validate host entries and build their request payloads.
+        
+        Invalid entries are recorded as failures. Payloads are built in one
+        comprehension after validation and serialized together by the client.
+        """
+        append_failure = self.failures.append
+        # One batch pass over all addresses instead of a validator call per entry
+        ip_ok = validate_ips_batch(ip for _, ip, _ in host_list)
+        
+        valid = []
+        for entry, ok in zip(host_list, ip_ok):
+            name, ip, _ = entry
+            if ok:
+                valid.append(entry)
+            else:
+                self.client.logger.warning("Invalid IP for %s: %s", name, ip)
+                self.failure_count += 1
+                append_failure((name, "Invalid IP address"))
+        
+        return [
+            {"name": name, "type": "Host", "value": ip, "description": description}
+            for name, ip, description in valid
+        ]
+    
     def bulk_create_hosts(self, host_list: List[Tuple[str, str, str]]) -> dict:
         """
         Create multiple host objects.
@@ -49,38 +129,62 @@ class BulkOperationsManager:
         
         self.client.logger.info(f"Starting bulk creation of {len(host_list)} hosts")
         
-        for name, ip, description in host_list:
-            # Validate IP
-            if not validate_ip_address(ip):
-                self.client.logger.warning(f"Invalid IP for {name}: {ip}")
-                self.failure_count += 1
-                self.failures.append((name, "Invalid IP address"))
-                continue
-            
-            # Create host
-            data = {
-                "name": name,
-                "type": "Host",
-                "value": ip,
-                "description": description
+        payloads = self._host_payloads(host_list)
+        
+        # One bulk request per 1000 hosts instead of one request per host
+        self._post_bulk("object/hosts", payloads)
+        
+        return self._summary(len(host_list))
+    
+    def bulk_create_hosts_parallel(self, host_list: List[Tuple[str, str, str]],
+                                   workers: int = 8) -> dict:
+        """
+        Create multiple host objects with several requests in flight.
+        
+        Payloads are validated and built up front, then posted from a
+        thread pool over the client's shared connection pool. The client's
+        request pacing still applies across all workers.
+        
+        Args:
+            host_list: List of (name, ip, description) tuples
+            workers: Maximum concurrent requests
+        
+        Returns:
+            Summary of operations
+        """
+        self.reset_counters()
+        
+        self.client.logger.info(f"Starting parallel creation of {len(host_list)} hosts")
+        
+        payloads = self._host_payloads(host_list)
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.client.post, "object/hosts", data): data["name"]
+                for data in payloads
             }
             
-            result = self.client.post("object/hosts", data)
-            
-            if result:
-                self.success_count += 1
-                self.client.logger.info(f"✓ Created: {name}")
-            else:
-                self.failure_count += 1
-                self.failures.append((name, "API request failed"))
-                self.client.logger.error(f"✗ Failed: {name}")
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = None
+                    self.client.logger.error("Request for %s raised: %s", name, e)
+                
+                with self._lock:
+                    if result:
+                        self.success_count += 1
+                    else:
+                        self.failure_count += 1
+                        self.failures.append((name, "API request failed"))
+                
+                if result:
+                    self.client.logger.debug("✓ Created: %s", name)
+                else:
+                    self.client.logger.error("✗ Failed: %s", name)
         
-        return {
-            "total": len(host_list),
-            "success": self.success_count,
-            "failed": self.failure_count,
-            "failures": self.failures
-        }
+        return self._summary(len(host_list))
     
     def bulk_create_networks(self, network_list: List[Tuple[str, str, str]]) -> dict:
         """
@@ -96,85 +200,74 @@ class BulkOperationsManager:
         
         self.client.logger.info(f"Starting bulk creation of {len(network_list)} networks")
         
-        for name, network, description in network_list:
+        valid = []
+        for entry in network_list:
+            name, network, _ = entry
             # Validate network
-            if not validate_ip_network(network):
-                self.client.logger.warning(f"Invalid network for {name}: {network}")
-                self.failure_count += 1
-                self.failures.append((name, "Invalid network format"))
-                continue
-            
-            # Create network
-            data = {
-                "name": name,
-                "type": "Network",
-                "value": network,
-                "description": description
-            }
-            
-            result = self.client.post("object/networks", data)
-            
-            if result:
-                self.success_count += 1
-                self.client.logger.info(f"✓ Created: {name}")
+            if validate_ip_network(network):
+                valid.append(entry)
             else:
+                self.client.logger.warning("Invalid network for %s: %s", name, network)
                 self.failure_count += 1
-                self.failures.append((name, "API request failed"))
-                self.client.logger.error(f"✗ Failed: {name}")
+                self.failures.append((name, "Invalid network format"))
         
-        return {
-            "total": len(network_list),
-            "success": self.success_count,
-            "failed": self.failure_count,
-            "failures": self.failures
-        }
+        payloads = [
+            {"name": name, "type": "Network", "value": network, "description": description}
+            for name, network, description in valid
+        ]
+        
+        self._post_bulk("object/networks", payloads)
+        
+        return self._summary(len(network_list))
     
     def export_network_objects(self, output_file: str = "network_objects.csv"):
-        """Export all network objects to CSV."""
+        """
+        Export all network objects to CSV.
+        
+        Objects are streamed from the API straight into the file, so memory
+        use is bounded by a few pages rather than the number of objects.
+        """
         self.client.logger.info("Exporting network objects...")
         
-        # Get all hosts
-        hosts = self.client.get_all_pages("object/hosts")
+        total = 0
         
-        # Get all networks
-        networks = self.client.get_all_pages("object/networks")
+        def rows(obj_type: str, endpoint: str):
+            nonlocal total
+            # Next pages are fetched while the current one is written
+            for obj in self.client.iter_pages(endpoint, page_size=1000, prefetch=2):
+                total += 1
+                yield (obj_type, obj.get('name'), obj.get('value'), obj.get('description', ''))
         
-        # Write to CSV
-        with open(output_file, 'w', newline='') as csvfile:
+        # Write to CSV in one pass through a large buffer
+        with open(output_file, 'w', newline='', buffering=1 << 20, encoding='utf-8') as csvfile:
             writer = csv.writer(csvfile)
-            writer.writerow(['Type', 'Name', 'Value', 'Description'])
-            
-            for host in hosts:
-                writer.writerow([
-                    'Host',
-                    host.get('name'),
-                    host.get('value'),
-                    host.get('description', '')
-                ])
-            
-            for network in networks:
-                writer.writerow([
-                    'Network',
-                    network.get('name'),
-                    network.get('value'),
-                    network.get('description', '')
-                ])
-        
-        total = len(hosts) + len(networks)
+            writer.writerow(('Type', 'Name', 'Value', 'Description'))
+            writer.writerows(itertools.chain(
+                rows('Host', "object/hosts"),
+                rows('Network', "object/networks")
+            ))
+        
         self.client.logger.info(f"Exported {total} objects to {output_file}")
         return total
     
-    def import_from_csv(self, csv_file: str) -> dict:
+    def import_from_csv(self, csv_file: str, chunk_size: int = 500) -> dict:
         """
         Import network objects from CSV.
         
         CSV Format: Type,Name,Value,Description
+        
+        Rows are streamed and buffered per endpoint; each buffer is created
+        with one bulk request whenever it reaches chunk_size, so memory use
+        stays bounded for large files.
         """
         self.reset_counters()
         
         self.client.logger.info(f"Importing from {csv_file}")
         
-        with open(csv_file, 'r') as csvfile:
+        # Valid rows grouped by endpoint, flushed as bulk requests
+        pending = {"object/hosts": [], "object/networks": []}
+        
+        with open(csv_file, 'r', newline='', buffering=1 << 20) as csvfile:
             reader = csv.DictReader(csvfile)
             
             for row in reader:
@@ -184,132 +277,118 @@ class BulkOperationsManager:
                 description = row.get('Description', '')
                 
                 # Determine endpoint and validate
-                if obj_type == 'Host':
-                    if not validate_ip_address(value):
-                        self.failure_count += 1
-                        self.failures.append((name, "Invalid IP"))
-                        continue
-                    endpoint = "object/hosts"
-                elif obj_type == 'Network':
-                    if not validate_ip_network(value):
-                        self.failure_count += 1
-                        self.failures.append((name, "Invalid network"))
-                        continue
-                    endpoint = "object/networks"
-                else:
+                handler = _CSV_TYPES.get(obj_type)
+                if handler is None:
                     self.failure_count += 1
                     self.failures.append((name, f"Unknown type: {obj_type}"))
                     continue
                 
-                # Create object
-                data = {
+                validate, endpoint, reason = handler
+                if not validate(value):
+                    self.failure_count += 1
+                    self.failures.append((name, reason))
+                    continue
+                
+                buf = pending[endpoint]
+                buf.append({
                     "name": name,
                     "type": obj_type,
                     "value": value,
                     "description": description
-                }
-                
-                result = self.client.post(endpoint, data)
-                
-                if result:
-                    self.success_count += 1
-                else:
-                    self.failure_count += 1
-                    self.failures.append((name, "API request failed"))
+                })
+                if len(buf) >= chunk_size:
+                    self._post_bulk(endpoint, buf)
+                    buf.clear()
         
-        return {
-            "success": self.success_count,
-            "failed": self.failure_count,
-            "failures": self.failures
-        }
+        for endpoint, buf in pending.items():
+            self._post_bulk(endpoint, buf)
+        
+        return self._summary()
 
 
-def example_bulk_host_creation():
+def example_bulk_host_creation(client: FMCClient):
     """Create multiple hosts from a list."""
     print("=" * 60)
     print("Example 1: Bulk Host Creation")
     print("=" * 60)
     
-    with FMCClient() as client:
-        manager = BulkOperationsManager(client)
-        
-        # Define hosts to create
-        hosts = [
-            ("Server_01", "10.10.1.1", "Application server 01"),
-            ("Server_02", "10.10.1.2", "Application server 02"),
-            ("Server_03", "10.10.1.3", "Application server 03"),
-            ("Server_04", "10.10.1.4", "Application server 04"),
-            ("Server_05", "10.10.1.5", "Application server 05"),
-            ("DB_Primary", "10.10.2.10", "Primary database server"),
-            ("DB_Secondary", "10.10.2.11", "Secondary database server"),
-            ("LoadBalancer", "10.10.3.100", "Main load balancer"),
-        ]
-        
-        print(f"\nCreating {len(hosts)} host objects...")
-        
-        summary = manager.bulk_create_hosts(hosts)
-        
-        print(f"\n{'='*60}")
-        print(f"Bulk Creation Summary:")
-        print(f"  Total: {summary['total']}")
-        print(f"  ✓ Success: {summary['success']}")
-        print(f"  ✗ Failed: {summary['failed']}")
-        
-        if summary['failures']:
-            print(f"\nFailed objects:")
-            for name, reason in summary['failures']:
-                print(f"  • {name}: {reason}")
+    manager = BulkOperationsManager(client)
+    
+    # Define hosts to create
+    hosts = [
+        ("Server_01", "10.10.1.1", "Application server 01"),
+        ("Server_02", "10.10.1.2", "Application server 02"),
+        ("Server_03", "10.10.1.3", "Application server 03"),
+        ("Server_04", "10.10.1.4", "Application server 04"),
+        ("Server_05", "10.10.1.5", "Application server 05"),
+        ("DB_Primary", "10.10.2.10", "Primary database server"),
+        ("DB_Secondary", "10.10.2.11", "Secondary database server"),
+        ("LoadBalancer", "10.10.3.100", "Main load balancer"),
+    ]
+    
+    print(f"\nCreating {len(hosts)} host objects...")
+    
+    summary = manager.bulk_create_hosts(hosts)
+    
+    print(f"\n{'='*60}")
+    print(f"Bulk Creation Summary:")
+    print(f"  Total: {summary['total']}")
+    print(f"  ✓ Success: {summary['success']}")
+    print(f"  ✗ Failed: {summary['failed']}")
+    
+    if summary['failures']:
+        print(f"\nFailed objects:")
+        for name, reason in summary['failures']:
+            print(f"  • {name}: {reason}")
 
 
-def example_bulk_network_creation():
+def example_bulk_network_creation(client: FMCClient):
     """Create multiple networks from a list."""
     print("\n" + "=" * 60)
     print("Example 2: Bulk Network Creation")
     print("=" * 60)
     
-    with FMCClient() as client:
-        manager = BulkOperationsManager(client)
-        
-        # Define networks to create
-        networks = [
-            ("Branch_Office_LAN_1", "192.168.10.0/24", "Branch office 1 LAN"),
-            ("Branch_Office_LAN_2", "192.168.20.0/24", "Branch office 2 LAN"),
-            ("Branch_Office_LAN_3", "192.168.30.0/24", "Branch office 3 LAN"),
-            ("Data_Center_VLAN100", "10.100.0.0/24", "Data center VLAN 100"),
-            ("Data_Center_VLAN200", "10.200.0.0/24", "Data center VLAN 200"),
-            ("Cloud_VPC_Subnet", "172.31.0.0/16", "AWS VPC subnet"),
-        ]
-        
-        print(f"\nCreating {len(networks)} network objects...")
-        
-        summary = manager.bulk_create_networks(networks)
-        
-        print(f"\n{'='*60}")
-        print(f"Bulk Creation Summary:")
-        print(f"  Total: {summary['total']}")
-        print(f"  ✓ Success: {summary['success']}")
-        print(f"  ✗ Failed: {summary['failed']}")
+    manager = BulkOperationsManager(client)
+    
+    # Define networks to create
+    networks = [
+        ("Branch_Office_LAN_1", "192.168.10.0/24", "Branch office 1 LAN"),
+        ("Branch_Office_LAN_2", "192.168.20.0/24", "Branch office 2 LAN"),
+        ("Branch_Office_LAN_3", "192.168.30.0/24", "Branch office 3 LAN"),
+        ("Data_Center_VLAN100", "10.100.0.0/24", "Data center VLAN 100"),
+        ("Data_Center_VLAN200", "10.200.0.0/24", "Data center VLAN 200"),
+        ("Cloud_VPC_Subnet", "172.31.0.0/16", "AWS VPC subnet"),
+    ]
+    
+    print(f"\nCreating {len(networks)} network objects...")
+    
+    summary = manager.bulk_create_networks(networks)
+    
+    print(f"\n{'='*60}")
+    print(f"Bulk Creation Summary:")
+    print(f"  Total: {summary['total']}")
+    print(f"  ✓ Success: {summary['success']}")
+    print(f"  ✗ Failed: {summary['failed']}")
 
 
-def example_export_objects():
+def example_export_objects(client: FMCClient):
     """Export existing objects to CSV."""
     print("\n" + "=" * 60)
     print("Example 3: Export Objects to CSV")
     print("=" * 60)
     
-    with FMCClient() as client:
-        manager = BulkOperationsManager(client)
-        
-        output_file = "fmc_network_objects_export.csv"
-        
-        print(f"\nExporting network objects to {output_file}...")
-        total = manager.export_network_objects(output_file)
-        
-        print(f"\n✓ Exported {total} objects successfully")
-        print(f"  File: {output_file}")
+    manager = BulkOperationsManager(client)
+    
+    output_file = "fmc_network_objects_export.csv"
+    
+    print(f"\nExporting network objects to {output_file}...")
+    total = manager.export_network_objects(output_file)
+    
+    print(f"\n✓ Exported {total} objects successfully")
+    print(f"  File: {output_file}")
 
 
-def example_import_from_csv():
+def example_import_from_csv(client: FMCClient):
     """Import objects from CSV file."""
     print("\n" + "=" * 60)
     print("Example 4: Import from CSV")
@@ -330,23 +409,22 @@ def example_import_from_csv():
     
     print(f"\n2. Importing objects from CSV...")
     
-    with FMCClient() as client:
-        manager = BulkOperationsManager(client)
-        
-        summary = manager.import_from_csv(sample_csv)
-        
-        print(f"\n{'='*60}")
-        print(f"Import Summary:")
-        print(f"  ✓ Success: {summary['success']}")
-        print(f"  ✗ Failed: {summary['failed']}")
-        
-        if summary['failures']:
-            print(f"\nFailed imports:")
-            for name, reason in summary['failures']:
-                print(f"  • {name}: {reason}")
+    manager = BulkOperationsManager(client)
+    
+    summary = manager.import_from_csv(sample_csv)
+    
+    print(f"\n{'='*60}")
+    print(f"Import Summary:")
+    print(f"  ✓ Success: {summary['success']}")
+    print(f"  ✗ Failed: {summary['failed']}")
+    
+    if summary['failures']:
+        print(f"\nFailed imports:")
+        for name, reason in summary['failures']:
+            print(f"  • {name}: {reason}")
 
 
-def example_chunked_operations():
+def example_chunked_operations(client: FMCClient):
     """Process large operations in chunks."""
     print("\n" + "=" * 60)
     print("Example 5: Chunked Operations")
@@ -360,83 +438,83 @@ def example_chunked_operations():
     
     print(f"\nProcessing {len(large_host_list)} objects in chunks...")
     
-    # Split into chunks of 10
-    chunks = chunk_list(large_host_list, 10)
+    # Split into chunks of 10; chunk_list yields them lazily
+    chunk_size = 10
+    chunks = chunk_list(large_host_list, chunk_size)
+    chunk_count = -(-len(large_host_list) // chunk_size)
     
-    print(f"  Split into {len(chunks)} chunks of 10 objects each")
+    print(f"  Split into {chunk_count} chunks of {chunk_size} objects each")
     
-    with FMCClient() as client:
-        manager = BulkOperationsManager(client)
-        
-        total_success = 0
-        total_failed = 0
+    manager = BulkOperationsManager(client)
+    
+    total_success = 0
+    total_failed = 0
+    
+    for idx, chunk in enumerate(chunks, 1):
+        print(f"\n  Processing chunk {idx}/{chunk_count}...")
         
-        for idx, chunk in enumerate(chunks, 1):
-            print(f"\n  Processing chunk {idx}/{len(chunks)}...")
-            
-            summary = manager.bulk_create_hosts(chunk)
-            total_success += summary['success']
-            total_failed += summary['failed']
-            
-            print(f"    ✓ {summary['success']} success, ✗ {summary['failed']} failed")
+        summary = manager.bulk_create_hosts(chunk)
+        total_success += summary['success']
+        total_failed += summary['failed']
         
-        print(f"\n{'='*60}")
-        print(f"Overall Summary:")
-        print(f"  Total processed: {len(large_host_list)}")
-        print(f"  ✓ Total success: {total_success}")
-        print(f"  ✗ Total failed: {total_failed}")
+        print(f"    ✓ {summary['success']} success, ✗ {summary['failed']} failed")
+    
+    print(f"\n{'='*60}")
+    print(f"Overall Summary:")
+    print(f"  Total processed: {len(large_host_list)}")
+    print(f"  ✓ Total success: {total_success}")
+    print(f"  ✗ Total failed: {total_failed}")
 
 
-def example_error_handling_and_rollback():
+def example_error_handling_and_rollback(client: FMCClient):
     """Demonstrate error handling and rollback logic."""
     print("\n" + "=" * 60)
     print("Example 6: Error Handling & Rollback")
     print("=" * 60)
     
-    with FMCClient() as client:
-        print("\n1. Creating test objects...")
-        
-        # Create some objects with intentional errors
-        test_data = [
-            ("Valid_Host_1", "10.60.1.1", "Valid host"),
-            ("Invalid_Host", "999.999.999.999", "Invalid IP"),  # Will fail
-            ("Valid_Host_2", "10.60.1.2", "Valid host"),
-        ]
-        
-        created_objects = []
-        
-        for name, ip, desc in test_data:
-            if not validate_ip_address(ip):
-                print(f"  ✗ Validation failed: {name} ({ip})")
-                
-                # Rollback: delete previously created objects
-                if created_objects:
-                    print(f"\n2. Rolling back {len(created_objects)} created objects...")
-                    for obj_id in created_objects:
-                        client.delete(f"object/hosts/{obj_id}")
-                        print(f"    Deleted: {obj_id}")
-                
-                print("\n  ⚠ Operation aborted due to validation error")
-                return
-            
-            # Create the object
-            data = {
-                "name": name,
-                "type": "Host",
-                "value": ip,
-                "description": desc
-            }
+    print("\n1. Creating test objects...")
+    
+    # Create some objects with intentional errors
+    test_data = [
+        ("Valid_Host_1", "10.60.1.1", "Valid host"),
+        ("Invalid_Host", "999.999.999.999", "Invalid IP"),  # Will fail
+        ("Valid_Host_2", "10.60.1.2", "Valid host"),
+    ]
+    
+    created_objects = []
+    
+    for name, ip, desc in test_data:
+        if not validate_ip_address(ip):
+            print(f"  ✗ Validation failed: {name} ({ip})")
             
-            result = client.post("object/hosts", data)
+            # Rollback: delete previously created objects
+            if created_objects:
+                print(f"\n2. Rolling back {len(created_objects)} created objects...")
+                for obj_id in created_objects:
+                    client.delete(f"object/hosts/{obj_id}")
+                    print(f"    Deleted: {obj_id}")
             
-            if result:
-                created_objects.append(result.get('id'))
-                print(f"  ✓ Created: {name}")
-            else:
-                print(f"  ✗ Failed: {name}")
-                # Rollback logic would go here
+            print("\n  ⚠ Operation aborted due to validation error")
+            return
+        
+        # Create the object
+        data = {
+            "name": name,
+            "type": "Host",
+            "value": ip,
+            "description": desc
+        }
         
-        print(f"\n  ✓ Successfully created {len(created_objects)} objects")
+        result = client.post("object/hosts", data)
+        
+        if result:
+            created_objects.append(result.get('id'))
+            print(f"  ✓ Created: {name}")
+        else:
+            print(f"  ✗ Failed: {name}")
+            # Rollback logic would go here
+    
+    print(f"\n  ✓ Successfully created {len(created_objects)} objects")
 
 
 def main():
@@ -445,12 +523,14 @@ def main():
         print("\n⚠ WARNING: These examples will create many objects in your FMC")
         print("Make sure you're connected to a test/lab environment\n")
         
-        example_bulk_host_creation()
-        example_bulk_network_creation()
-        example_export_objects()
-        example_import_from_csv()
-        # example_chunked_operations()  # Uncomment to create 100 objects
-        example_error_handling_and_rollback()
+        # One authenticated session is shared by all examples
+        with FMCClient() as client:
+            example_bulk_host_creation(client)
+            example_bulk_network_creation(client)
+            example_export_objects(client)
+            example_import_from_csv(client)
+            # example_chunked_operations(client)  # Uncomment to create 100 objects
+            example_error_handling_and_rollback(client)
         
         print("\n" + "=" * 60)
         print("Bulk operation examples completed!")
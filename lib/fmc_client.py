@@ -4,34 +4,67 @@ Provides authentication, token management, and base API operations.
 """
 
 import requests
-import json
+import urllib3
+import itertools
+import logging
+import os
+import threading
 import time
-from typing import Dict, Optional, Any, List
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type
-)
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Any, List, Iterable, Iterator
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from config.fmc_config import FMCConfig
-from lib.utils import setup_logging, rate_limit, format_api_error
+from config.fmc_config import FMCConfig, get_config
+from lib.utils import setup_logging, format_api_error, chunk_list, TokenBucket, _loads, _dumps
+
+
+# Page size for name-filter lookups. The filter can match substrings, so
+# fetch a few candidates rather than one and pick the exact name among them.
+_NAME_FILTER_LIMIT = 25
+
+# FMC accepts at most this many objects in one bulk request
+_BULK_LIMIT = 1000
+
+# Largest page FMC serves on most collections, and the size every
+# endpoint accepts if a large page is rejected
+_MAX_PAGE_SIZE = 1000
+_SAFE_PAGE_SIZE = 100
+
+# Per-request headers for JSON bodies; the token is a session header
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Set once InsecureRequestWarning has been silenced for this process
+_WARNINGS_DISABLED = False
+
+# Access token persisted between runs when FMC_TOKEN_CACHE is enabled
+_TOKEN_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'fmc', 'token.json')
 
 
 class FMCClient:
     """
     Client for interacting with Cisco FMC REST API.
     Handles authentication, token refresh, and API requests.
+    
+    Requests share one keep-alive HTTP/1.1 connection pool. For HTTP/2
+    multiplexing of many concurrent calls, see AsyncFMCClient in
+    lib/fmc_client_async.py.
     """
     
+    # (host, username) -> client handed out by get_shared()
+    _shared = {}
+    _shared_lock = threading.Lock()
+    
     def __init__(self, config: Optional[FMCConfig] = None):
         """
         Initialize FMC client.
         
         Args:
-            config: FMC configuration object. If None, loads from environment.
+            config: FMC configuration object. If None, uses the shared
+                configuration loaded from environment.
         """
-        self.config = config or FMCConfig()
+        self.config = config or get_config()
         self.logger = setup_logging(self.config.log_level)
         
         self.token = None
@@ -39,13 +72,66 @@ class FMCClient:
         self.domain_uuid = None
         self.token_expiry = 0
         
+        # Domain-scoped URL prefix, fixed once the domain UUID is known
+        self._api_prefix = ''
+        
+        # Serializes token refresh and re-login across worker threads
+        self._auth_lock = threading.Lock()
+        
+        # One token bucket shared by all verbs and threads. The small burst
+        # keeps any 60 s window close to max_requests_per_minute.
+        rate = self.config.max_requests_per_minute
+        self._bucket = TokenBucket(rate=rate / 60.0, capacity=max(1, rate // 10))
+        
+        # (url, params) -> (ETag, decoded body) for conditional GETs
+        self._etag_cache = {}
+        
+        # (endpoint, name) -> object for name lookups within this session
+        self._name_cache = {}
+        # Endpoints where FMC rejected or ignored an exact 'name' query parameter
+        self._exact_name_unsupported = set()
+        
+        # Last deployment request version handed out; see next_deploy_version()
+        self._deploy_version = 0
+        self._deploy_lock = threading.Lock()
+        
+        # Open 'with' blocks on a shared client; None if not shared
+        self._shared_key = None
+        self._refs = 0
+        
         self.session = requests.Session()
-        self.session.verify = self.config.get_verify_param()
+        self.session.verify = self.config.verify_param
+        
+        # Keep-alive connection pool. Connection errors, rate limiting and
+        # transient gateway errors are retried at the connection layer with
+        # exponential backoff, honoring Retry-After on 429/503.
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            pool_block=False,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=1,
+                status_forcelist=(429, 502, 503, 504),
+                allowed_methods=frozenset(['GET', 'POST', 'PUT', 'DELETE']),
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        # Ask for compressed bodies; requests decompresses transparently
+        self.session.headers['Accept-Encoding'] = 'gzip, deflate'
+        # Ask intermediaries to keep the pooled sockets open
+        self.session.headers['Connection'] = 'keep-alive'
         
         # Suppress SSL warnings if verification is disabled (lab only)
         if not self.config.verify_ssl:
-            import urllib3
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            global _WARNINGS_DISABLED
+            if not _WARNINGS_DISABLED:
+                urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+                _WARNINGS_DISABLED = True
             self.logger.warning("SSL verification is disabled - use only in lab environments!")
         
         self.logger.info(f"FMC Client initialized for {self.config.host}")
@@ -57,6 +143,10 @@ class FMCClient:
         Returns:
             True if authentication successful, False otherwise
         """
+        if self.config.token_cache and self._load_cached_token():
+            self.logger.info("Reusing cached access token")
+            return True
+        
         url = f"{self.config.platform_url}/auth/generatetoken"
         
         try:
@@ -73,9 +163,12 @@ class FMCClient:
                 self.token = response.headers.get('X-auth-access-token')
                 self.refresh_token = response.headers.get('X-auth-refresh-token')
                 self.domain_uuid = response.headers.get('DOMAIN_UUID')
+                self._api_prefix = f"{self.config.base_url}/domain/{self.domain_uuid}/"
+                self._build_headers()
                 
                 # Token expires in 30 minutes
                 self.token_expiry = time.time() + (30 * 60)
+                self._save_cached_token()
                 
                 self.logger.info("Authentication successful")
                 self.logger.debug(f"Domain UUID: {self.domain_uuid}")
@@ -114,6 +207,8 @@ class FMCClient:
                 self.token = response.headers.get('X-auth-access-token')
                 self.refresh_token = response.headers.get('X-auth-refresh-token')
                 self.token_expiry = time.time() + (30 * 60)
+                self._build_headers()
+                self._save_cached_token()
                 
                 self.logger.info("Token refresh successful")
                 return True
@@ -125,68 +220,226 @@ class FMCClient:
             self.logger.error(f"Error during token refresh: {e}")
             return self.authenticate()
     
-    def _ensure_authenticated(self):
-        """Ensure valid authentication token exists."""
-        if not self.token:
-            self.authenticate()
-        elif time.time() >= (self.token_expiry - 60):  # Refresh 1 min before expiry
-            self.refresh_auth_token()
+    def _cache_key(self) -> List[str]:
+        """Identify the FMC account a cached token belongs to."""
+        return [self.config.host, self.config.username]
+    
+    def _load_cached_token(self) -> bool:
+        """
+        Adopt a token saved by an earlier run, if it is still valid.
+        
+        Returns:
+            True if a usable cached token was loaded, False otherwise
+        """
+        try:
+            with open(_TOKEN_CACHE_PATH, 'rb') as f:
+                cached = _loads(f.read())
+            if cached['key'] != self._cache_key() or cached['expiry'] <= time.time() + 60:
+                return False
+            self.token = cached['token']
+            self.refresh_token = cached['refresh_token']
+            self.domain_uuid = cached['domain_uuid']
+            self.token_expiry = cached['expiry']
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        
+        self._api_prefix = f"{self.config.base_url}/domain/{self.domain_uuid}/"
+        self._build_headers()
+        return True
+    
+    def _save_cached_token(self):
+        """Persist the current token with owner-only permissions."""
+        if not self.config.token_cache:
+            return
+        
+        try:
+            os.makedirs(os.path.dirname(_TOKEN_CACHE_PATH), mode=0o700, exist_ok=True)
+            tmp_path = f"{_TOKEN_CACHE_PATH}.{os.getpid()}.tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_dumps({
+                    'key': self._cache_key(),
+                    'token': self.token,
+                    'refresh_token': self.refresh_token,
+                    'domain_uuid': self.domain_uuid,
+                    'expiry': self.token_expiry
+                }))
+            os.replace(tmp_path, _TOKEN_CACHE_PATH)
+        except OSError as e:
+            self.logger.debug(f"Could not write token cache: {e}")
+    
+    def _discard_cached_token(self):
+        """Remove the persisted token."""
+        if not self.config.token_cache:
+            return
+        
+        try:
+            os.remove(_TOKEN_CACHE_PATH)
+        except OSError:
+            pass
+    
+    def _ensure_authenticated(self) -> bool:
+        """
+        Ensure valid authentication token exists.
+        
+        Safe to call from several threads: only one of them refreshes or
+        logs in, and the others reuse the token it obtained.
+        
+        Returns:
+            True if a usable token is available, False if login failed
+        """
+        if self.token and time.time() < (self.token_expiry - 60):
+            return True
+        
+        with self._auth_lock:
+            # Another thread may have renewed the token while we waited
+            if not self.token:
+                return self.authenticate()
+            elif time.time() >= (self.token_expiry - 60):  # Refresh 1 min before expiry
+                return self.refresh_auth_token()
+            return True
+    
+    def _reauthenticate(self, rejected_token: Optional[str]) -> bool:
+        """
+        Replace a token the server rejected with HTTP 401.
+        
+        Only the first thread to report a given token logs in again; the
+        token stays in place meanwhile for requests already in flight.
+        
+        Args:
+            rejected_token: Token the failed request was sent with
+        
+        Returns:
+            True if a different, usable token is now available
+        """
+        with self._auth_lock:
+            if self.token == rejected_token:
+                self.logger.warning("Access token rejected, re-authenticating...")
+                self._discard_cached_token()
+                if not self.authenticate():
+                    self.token = None
+                    self.session.headers.pop('X-auth-access-token', None)
+            return self.token is not None and self.token != rejected_token
+    
+    def _build_headers(self):
+        """Attach the current token to every request made by the session."""
+        self.session.headers['X-auth-access-token'] = self.token
     
     def _get_headers(self) -> Dict[str, str]:
-        """Get standard headers for API requests."""
-        return {
-            'Content-Type': 'application/json',
-            'X-auth-access-token': self.token
-        }
-    
-    @rate_limit(max_per_minute=100)
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(requests.exceptions.RequestException)
-    )
-    def get(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Dict]:
+        """Get per-request headers for JSON bodies (the token is a session header)."""
+        return _JSON_HEADERS
+    
+    def _send(self, method: str, url: str, headers: Optional[Dict[str, str]], **kwargs) -> requests.Response:
         """
-        Perform GET request to FMC API.
+        Send a request, re-authenticating and retrying once on HTTP 401.
+        
+        A 401 means the token was revoked or expired early (for example a
+        cached token from an earlier run), so it is discarded first.
+        
+        Args:
+            method: HTTP method
+            url: Full request URL
+            headers: Extra request headers, or None
+            kwargs: Additional arguments passed to session.request
+        
+        Returns:
+            Response object
+        """
+        request = self.session.request
+        timeout = self.config.api_timeout
+        sent_token = self.token
+        response = request(method, url, headers=headers, timeout=timeout, **kwargs)
+        
+        if response.status_code == 401 and self._reauthenticate(sent_token):
+            response = request(method, url, headers=headers, timeout=timeout, **kwargs)
+        
+        return response
+    
+    def _request(self, method: str, endpoint: str, ok_status: tuple,
+                 headers: Optional[Dict[str, str]] = None, quiet: bool = False,
+                 **kwargs) -> Optional[requests.Response]:
+        """
+        Perform an API request and return the response if its status is expected.
+        
+        Every verb goes through here, so authentication, pacing and error
+        logging are handled in one place. Retries happen below this, in the
+        session's urllib3 adapter.
         
         Args:
+            method: HTTP method
             endpoint: API endpoint (relative to base URL)
-            params: Query parameters
+            ok_status: Status codes treated as success
+            headers: Extra request headers, or None
+            quiet: Log an unexpected status at DEBUG instead of ERROR, for
+                requests whose failure is an expected outcome
+            kwargs: Additional arguments passed to session.request
         
         Returns:
-            Response data as dictionary, or None if request fails
+            Response object, or None if request fails
         """
-        self._ensure_authenticated()
+        if not self._ensure_authenticated():
+            self.logger.error(f"{method} {endpoint} not sent: not authenticated")
+            return None
+        self._bucket.acquire()
         
-        url = f"{self.config.base_url}/domain/{self.domain_uuid}/{endpoint}"
+        url = self._api_prefix + endpoint
         
         try:
-            self.logger.debug(f"GET {url}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("%s %s", method, url)
             
-            response = self.session.get(
-                url,
-                headers=self._get_headers(),
-                params=params,
-                timeout=self.config.api_timeout
-            )
+            response = self._send(method, url, headers, **kwargs)
             
-            if response.status_code == 200:
-                return response.json()
+            if response.status_code in ok_status:
+                return response
+            elif quiet:
+                self.logger.debug("%s request failed: %s", method, format_api_error(response))
+                return None
             else:
-                self.logger.error(f"GET request failed: {format_api_error(response)}")
+                self.logger.error(f"{method} request failed: {format_api_error(response)}")
                 return None
                 
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"GET request exception: {e}")
+            self.logger.error(f"{method} request exception: {e}")
             raise
     
-    @rate_limit(max_per_minute=100)
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(requests.exceptions.RequestException)
-    )
-    def post(self, endpoint: str, data: Dict) -> Optional[Dict]:
+    def get(self, endpoint: str, params: Optional[Dict] = None,
+            conditional: bool = False) -> Optional[Dict]:
+        """
+        Perform GET request to FMC API.
+        
+        Args:
+            endpoint: API endpoint (relative to base URL)
+            params: Query parameters
+            conditional: Send If-None-Match with the last ETag seen for this
+                request; a 304 reply returns the previously decoded data
+        
+        Returns:
+            Response data as dictionary, or None if request fails
+        """
+        if not conditional:
+            response = self._request('GET', endpoint, (200,), params=params)
+            return _loads(response.content) if response is not None else None
+        
+        cache_key = (endpoint, tuple(sorted(params.items())) if params else ())
+        cached = self._etag_cache.get(cache_key)
+        headers = {'If-None-Match': cached[0]} if cached else None
+        
+        response = self._request('GET', endpoint, (200, 304), headers=headers, params=params)
+        if response is None:
+            return None
+        
+        if response.status_code == 304:
+            # Unchanged since the last conditional GET; skip decoding
+            return cached[1] if cached else None
+        
+        data = _loads(response.content)
+        etag = response.headers.get('ETag')
+        if etag:
+            self._etag_cache[cache_key] = (etag, data)
+        return data
+    
+    def post(self, endpoint: str, data: Any) -> Optional[Dict]:
         """
         Perform POST request to FMC API.
         
@@ -197,37 +450,10 @@ class FMCClient:
         Returns:
             Response data as dictionary, or None if request fails
         """
-        self._ensure_authenticated()
-        
-        url = f"{self.config.base_url}/domain/{self.domain_uuid}/{endpoint}"
-        
-        try:
-            self.logger.debug(f"POST {url}")
-            
-            response = self.session.post(
-                url,
-                headers=self._get_headers(),
-                json=data,
-                timeout=self.config.api_timeout
-            )
-            
-            if response.status_code in [200, 201]:
-                return response.json()
-            else:
-                self.logger.error(f"POST request failed: {format_api_error(response)}")
-                return None
-                
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"POST request exception: {e}")
-            raise
+        response = self._request('POST', endpoint, (200, 201), _JSON_HEADERS, data=_dumps(data))
+        return _loads(response.content) if response is not None else None
     
-    @rate_limit(max_per_minute=100)
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(requests.exceptions.RequestException)
-    )
-    def put(self, endpoint: str, data: Dict) -> Optional[Dict]:
+    def put(self, endpoint: str, data: Any) -> Optional[Dict]:
         """
         Perform PUT request to FMC API.
         
@@ -238,36 +464,9 @@ class FMCClient:
         Returns:
             Response data as dictionary, or None if request fails
         """
-        self._ensure_authenticated()
-        
-        url = f"{self.config.base_url}/domain/{self.domain_uuid}/{endpoint}"
-        
-        try:
-            self.logger.debug(f"PUT {url}")
-            
-            response = self.session.put(
-                url,
-                headers=self._get_headers(),
-                json=data,
-                timeout=self.config.api_timeout
-            )
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                self.logger.error(f"PUT request failed: {format_api_error(response)}")
-                return None
-                
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"PUT request exception: {e}")
-            raise
+        response = self._request('PUT', endpoint, (200,), _JSON_HEADERS, data=_dumps(data))
+        return _loads(response.content) if response is not None else None
     
-    @rate_limit(max_per_minute=100)
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(requests.exceptions.RequestException)
-    )
     def delete(self, endpoint: str) -> bool:
         """
         Perform DELETE request to FMC API.
@@ -278,70 +477,299 @@ class FMCClient:
         Returns:
             True if deletion successful, False otherwise
         """
-        self._ensure_authenticated()
+        return self._request('DELETE', endpoint, (200,)) is not None
+    
+    def post_bulk(self, endpoint: str, items: List[Dict],
+                  chunk: int = _BULK_LIMIT) -> List[Dict]:
+        """
+        Create many objects through FMC's bulk endpoint.
         
-        url = f"{self.config.base_url}/domain/{self.domain_uuid}/{endpoint}"
+        Items are sent as JSON arrays to '<endpoint>?bulk=true', one request
+        per chunk. A failed chunk is logged and skipped, so callers can tell
+        which objects were not created by comparing against the result.
         
-        try:
-            self.logger.debug(f"DELETE {url}")
+        Args:
+            endpoint: Collection endpoint (without query string)
+            items: Object payloads to create
+            chunk: Objects per request (FMC allows at most 1000)
+        
+        Returns:
+            Created objects from all successful chunks
+        """
+        bulk_endpoint = endpoint + "?bulk=true"
+        created = []
+        
+        for batch in chunk_list(items, chunk):
+            result = self.post(bulk_endpoint, batch)
+            if result:
+                created.extend(result.get('items', []))
+        
+        return created
+    
+    def put_bulk(self, endpoint: str, items: List[Dict],
+                 chunk: int = _BULK_LIMIT) -> List[Dict]:
+        """
+        Update many objects through FMC's bulk endpoint.
+        
+        Same chunking as post_bulk(): each chunk is one PUT of a JSON array
+        to '<endpoint>?bulk=true', and a failed chunk is logged and skipped.
+        Every item must carry its 'id'.
+        
+        Args:
+            endpoint: Collection endpoint (without query string)
+            items: Full object payloads to update
+            chunk: Objects per request (FMC allows at most 1000)
+        
+        Returns:
+            Updated objects from all successful chunks
+        """
+        bulk_endpoint = endpoint + "?bulk=true"
+        updated = []
+        
+        for batch in chunk_list(items, chunk):
+            result = self.put(bulk_endpoint, batch)
+            if result:
+                updated.extend(result.get('items', []))
+        
+        return updated
+    
+    def post_many(self, endpoint: str, payloads: Iterable[Dict]) -> List[Optional[Dict]]:
+        """
+        POST many objects one at a time over a single prepared request path.
+        
+        For endpoints without bulk support. The URL and headers are built
+        once and the token is only re-checked when it nears expiry, instead
+        of going through the full per-call setup of post(). Pacing still
+        applies to every request, and a failed item does not stop the rest.
+        
+        Args:
+            endpoint: API endpoint
+            payloads: Request bodies, one per object
+        
+        Returns:
+            Response data for each payload in order, None where it failed
+        """
+        if not self._ensure_authenticated():
+            self.logger.error(f"POST {endpoint} not sent: not authenticated")
+            return [None for _ in payloads]
+        url = self._api_prefix + endpoint
+        acquire = self._bucket.acquire
+        send = self._send
+        
+        results = []
+        for payload in payloads:
+            if time.time() >= self.token_expiry - 60 and not self._ensure_authenticated():
+                results.append(None)
+                continue
+            acquire()
             
-            response = self.session.delete(
-                url,
-                headers=self._get_headers(),
-                timeout=self.config.api_timeout
-            )
+            try:
+                response = send('POST', url, _JSON_HEADERS, data=_dumps(payload))
+            except requests.exceptions.RequestException as e:
+                self.logger.error(f"POST request exception: {e}")
+                results.append(None)
+                continue
             
-            if response.status_code == 200:
-                return True
+            if response.status_code in (200, 201):
+                results.append(_loads(response.content))
             else:
-                self.logger.error(f"DELETE request failed: {format_api_error(response)}")
-                return False
-                
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"DELETE request exception: {e}")
-            raise
+                self.logger.error(f"POST request failed: {format_api_error(response)}")
+                results.append(None)
+        
+        return results
     
-    def get_all_pages(self, endpoint: str, params: Optional[Dict] = None) -> List[Dict]:
+    def iter_pages(self, endpoint: str, params: Optional[Dict] = None,
+                   page_size: int = 100, prefetch: int = 0) -> Iterator[Dict]:
         """
-        Get all pages of paginated results.
+        Iterate over paginated results one page at a time.
+        
+        Only a bounded number of pages is held in memory. Without prefetch,
+        pages after the point where the caller stops iterating are never
+        requested; with prefetch, up to that many later pages are fetched
+        in the background while the current one is consumed.
         
         Args:
             endpoint: API endpoint
             params: Query parameters
+            page_size: Items requested per page
+            prefetch: Number of upcoming pages to request concurrently
         
-        Returns:
-            List of all items across all pages
+        Yields:
+            Individual items across all pages
         """
-        all_items = []
-        offset = 0
-        limit = 100  # Max items per page
+        params = dict(params or {})
         
-        if params is None:
-            params = {}
+        def fetch(offset: int) -> Optional[Dict]:
+            return self.get(endpoint, {**params, 'offset': offset, 'limit': page_size})
         
-        while True:
-            params['offset'] = offset
-            params['limit'] = limit
-            
-            response = self.get(endpoint, params)
-            
-            if not response or 'items' not in response:
-                break
-            
-            items = response['items']
-            all_items.extend(items)
+        first = fetch(0)
+        if first is None and page_size > _SAFE_PAGE_SIZE:
+            # Some endpoints reject large limits; retry once at a safe size
+            self.logger.debug(f"Page size {page_size} rejected for {endpoint}, retrying with {_SAFE_PAGE_SIZE}")
+            page_size = _SAFE_PAGE_SIZE
+            first = fetch(0)
+        
+        if not first or 'items' not in first:
+            return
+        
+        yield from first['items']
+        
+        # The first page reports the total, so every later offset is known
+        count = first.get('paging', {}).get('count', 0)
+        offsets = iter(range(page_size, count, page_size))
+        
+        if prefetch <= 0:
+            for offset in offsets:
+                page = fetch(offset)
+                if not page or 'items' not in page:
+                    return
+                yield from page['items']
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=prefetch)
+        try:
+            # Ordered window of in-flight page requests
+            pending = deque(executor.submit(fetch, o) for o in itertools.islice(offsets, prefetch))
             
-            # Check if there are more pages
-            paging = response.get('paging', {})
-            if offset + limit >= paging.get('count', 0):
-                break
+            while pending:
+                page = pending.popleft().result()
+                if not page or 'items' not in page:
+                    return
+                
+                offset = next(offsets, None)
+                if offset is not None:
+                    pending.append(executor.submit(fetch, offset))
+                
+                yield from page['items']
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _fetch_pages(self, endpoint: str, params: Optional[Dict],
+                     page_size: int, workers: int) -> List[Dict]:
+        """
+        Fetch every page, requesting all pages after the first concurrently.
+        
+        The first page also reports paging.count, so every remaining
+        (offset, limit) pair is known up front. Items are returned in
+        offset order; the client's pacing applies across workers.
+        """
+        params = dict(params or {})
+        
+        first = self.get(endpoint, {**params, 'offset': 0, 'limit': page_size})
+        if first is None and page_size > _SAFE_PAGE_SIZE:
+            # Some endpoints reject large limits; retry once at a safe size
+            self.logger.debug(f"Page size {page_size} rejected for {endpoint}, retrying with {_SAFE_PAGE_SIZE}")
+            page_size = _SAFE_PAGE_SIZE
+            first = self.get(endpoint, {**params, 'offset': 0, 'limit': page_size})
+        
+        if not first or 'items' not in first:
+            return []
+        
+        all_items = list(first['items'])
+        count = first.get('paging', {}).get('count', len(all_items))
+        offsets = range(page_size, count, page_size)
+        
+        if offsets:
+            def fetch(offset: int) -> List[Dict]:
+                page = self.get(endpoint, {**params, 'offset': offset, 'limit': page_size})
+                return page.get('items', []) if page else []
             
-            offset += limit
-            self.logger.debug(f"Fetched {len(all_items)} items so far...")
+            with ThreadPoolExecutor(max_workers=min(workers, len(offsets))) as executor:
+                for items in executor.map(fetch, offsets):
+                    all_items.extend(items)
         
         self.logger.info(f"Retrieved total of {len(all_items)} items")
         return all_items
     
+    def get_all_pages(self, endpoint: str, params: Optional[Dict] = None,
+                      page_size: int = _MAX_PAGE_SIZE, workers: int = 8) -> List[Dict]:
+        """
+        Get all pages of paginated results.
+        
+        Pages after the first are prefetched concurrently once the total
+        count is known. If the first request fails at a large page size,
+        it is retried once with 100 items per page.
+        
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            page_size: Items requested per page
+            workers: Maximum concurrent page requests
+        
+        Returns:
+            List of all items across all pages
+        """
+        return self._fetch_pages(endpoint, params, page_size, workers)
+    
+    def get_by_name(self, endpoint: str, name: str) -> Optional[Dict]:
+        """
+        Look up a single object by name.
+        
+        Results are cached for the life of the client, so repeated lookups
+        of the same name cost no extra requests. Call invalidate_name_cache()
+        after changes that could affect the result.
+        
+        Args:
+            endpoint: Collection endpoint (e.g. 'policy/accesspolicies')
+            name: Object name
+        
+        Returns:
+            First matching object, or None if not found
+        """
+        cache_key = (endpoint, name)
+        if cache_key in self._name_cache:
+            return self._name_cache[cache_key]
+        
+        if endpoint not in self._exact_name_unsupported:
+            # The answer checks itself: a server that filters returns at most
+            # one object with exactly this name, so an empty page means "not
+            # found" and one match is the object. Anything else means the
+            # parameter was rejected or ignored, and is not an API error.
+            response = self._request('GET', endpoint, (200,), quiet=True,
+                                     params={"name": name, "limit": 2, "expanded": "false"})
+            items = (_loads(response.content).get('items') or []) if response is not None else None
+            if items is not None and len(items) <= 1:
+                if not items:
+                    return None
+                if items[0].get('name') == name:
+                    self._name_cache[cache_key] = items[0]
+                    return items[0]
+            self.logger.debug("Exact name lookup not supported for %s, using name filter", endpoint)
+            self._exact_name_unsupported.add(endpoint)
+        
+        result = self.get(endpoint, params={
+            "filter": f"name:{name}",
+            "offset": 0,
+            "limit": _NAME_FILTER_LIMIT,
+            "expanded": "false"
+        })
+        items = (result or {}).get('items') or []
+        # The name filter may match substrings; prefer the exact name
+        item = next((i for i in items if i.get('name') == name), items[0] if items else None)
+        
+        if item is not None:
+            self._name_cache[cache_key] = item
+        return item
+    
+    def invalidate_name_cache(self):
+        """Discard cached name lookups."""
+        self._name_cache.clear()
+    
+    def next_deploy_version(self) -> int:
+        """
+        Get a version for a new deployment request.
+        
+        Versions are the current time in epoch milliseconds, and strictly
+        increasing across threads, so requests submitted within the same
+        millisecond still get distinct versions.
+        
+        Returns:
+            Deployment request version
+        """
+        with self._deploy_lock:
+            self._deploy_version = max(int(time.time() * 1000), self._deploy_version + 1)
+            return self._deploy_version
+    
     def logout(self):
         """Revoke authentication token and logout."""
         if not self.token:
@@ -361,18 +789,72 @@ class FMCClient:
             if response.status_code == 204:
                 self.logger.info("Logout successful")
             
+            self._discard_cached_token()
             self.token = None
             self.refresh_token = None
             self.domain_uuid = None
+            self._api_prefix = ''
+            self.session.headers.pop('X-auth-access-token', None)
+            self._name_cache.clear()
             
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Error during logout: {e}")
     
+    def close(self):
+        """Close pooled connections held by the session."""
+        self.session.close()
+    
+    @classmethod
+    def get_shared(cls, config: Optional[FMCConfig] = None) -> 'FMCClient':
+        """
+        Get a client shared by every caller using the same FMC credentials.
+        
+        'with' blocks on a shared client nest: the first one authenticates,
+        and only the last one to exit logs out and closes the connection
+        pool. Wrap a sequence of operations in an outer 'with' block to
+        keep one session and warm connections across all of them.
+        
+        Args:
+            config: FMC configuration object. If None, uses the shared
+                configuration loaded from environment.
+        
+        Returns:
+            Shared FMCClient instance
+        """
+        config = config or get_config()
+        key = (config.host, config.username)
+        
+        with cls._shared_lock:
+            client = cls._shared.get(key)
+            if client is None:
+                client = cls(config)
+                client._shared_key = key
+                cls._shared[key] = client
+            return client
+    
     def __enter__(self):
         """Context manager entry."""
-        self.authenticate()
+        if self._shared_key is None:
+            self.authenticate()
+            return self
+        
+        with self._shared_lock:
+            self._refs += 1
+            first = self._refs == 1
+        if first:
+            self.authenticate()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        self.logout()
+        if self._shared_key is not None:
+            with self._shared_lock:
+                self._refs -= 1
+                if self._refs > 0:
+                    return
+                self._shared.pop(self._shared_key, None)
+        
+        # A cached token is left valid for the next run; logout() revokes it
+        if not self.config.token_cache:
+            self.logout()
+        self.close()
@@ -0,0 +1,400 @@
+"""
+Asynchronous Cisco FMC REST API Client.
+Provides the same authentication and base API operations as FMCClient,
+on top of httpx.AsyncClient, for scripts that issue many requests at once.
+
+Requires the optional httpx dependency: pip install "httpx[http2]"
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Optional, Any, List
+
+import httpx
+
+from config.fmc_config import FMCConfig, get_config
+from lib.utils import setup_logging, format_api_error, TokenBucket, _loads, _dumps
+
+# HTTP/2 needs the h2 package (the httpx[http2] extra); without it the
+# client falls back to pooled HTTP/1.1 connections
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Same retry policy as FMCClient's urllib3 Retry: up to 3 retries with
+# exponential backoff (1 s, 2 s, 4 s), honoring Retry-After
+_RETRY_STATUS = frozenset((429, 502, 503, 504))
+_MAX_RETRIES = 3
+_BACKOFF_FACTOR = 1.0
+
+
+class AsyncFMCClient:
+    """
+    Async client for interacting with Cisco FMC REST API.
+    Concurrent requests are multiplexed over a shared HTTP/2 connection pool
+    when h2 is installed, and spread over pooled HTTP/1.1 connections otherwise.
+    """
+    
+    def __init__(self, config: Optional[FMCConfig] = None):
+        """
+        Initialize async FMC client.
+        
+        Args:
+            config: FMC configuration object. If None, uses the shared
+                configuration loaded from environment.
+        """
+        self.config = config or get_config()
+        self.logger = setup_logging(self.config.log_level)
+        
+        self.token = None
+        self.refresh_token = None
+        self.domain_uuid = None
+        self.token_expiry = 0
+        
+        # Domain-scoped URL prefix, fixed once the domain UUID is known
+        self._api_prefix = ''
+        
+        self._http = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            verify=self.config.verify_param,
+            timeout=self.config.api_timeout,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            # Ask for compressed bodies; httpx decompresses transparently
+            headers={'Accept-Encoding': 'gzip, deflate'}
+        )
+        
+        # Serializes token refresh across tasks
+        self._auth_lock = asyncio.Lock()
+        
+        # Same pacing as FMCClient; replaced by the sync client's bucket in share_token()
+        rate = self.config.max_requests_per_minute
+        self._bucket = TokenBucket(rate=rate / 60.0, capacity=max(1, rate // 10))
+        
+        # Sync client this one borrows its token from, if any
+        self._peer = None
+        
+        if not self.config.verify_ssl:
+            self.logger.warning("SSL verification is disabled - use only in lab environments!")
+        
+        self.logger.info(f"Async FMC Client initialized for {self.config.host}")
+    
+    async def authenticate(self) -> bool:
+        """
+        Authenticate with FMC and obtain access token.
+        
+        Returns:
+            True if authentication successful, False otherwise
+        """
+        url = f"{self.config.platform_url}/auth/generatetoken"
+        
+        try:
+            self.logger.info(f"Authenticating to FMC at {self.config.host}...")
+            
+            response = await self._http.post(
+                url,
+                auth=(self.config.username, self.config.password),
+                headers={'Content-Type': 'application/json'}
+            )
+            
+            if response.status_code == 204:
+                self.token = response.headers.get('X-auth-access-token')
+                self.refresh_token = response.headers.get('X-auth-refresh-token')
+                self.domain_uuid = response.headers.get('DOMAIN_UUID')
+                self._api_prefix = f"{self.config.base_url}/domain/{self.domain_uuid}/"
+                
+                # Token expires in 30 minutes
+                self.token_expiry = time.time() + (30 * 60)
+                
+                self.logger.info("Authentication successful")
+                return True
+            else:
+                self.logger.error(f"Authentication failed: {format_api_error(response)}")
+                return False
+        
+        except httpx.HTTPError as e:
+            self.logger.error(f"Connection error during authentication: {e}")
+            return False
+    
+    async def refresh_auth_token(self) -> bool:
+        """
+        Refresh authentication token using refresh token.
+        
+        Returns:
+            True if refresh successful, False otherwise
+        """
+        url = f"{self.config.platform_url}/auth/refreshtoken"
+        
+        try:
+            self.logger.info("Refreshing authentication token...")
+            
+            response = await self._http.post(
+                url,
+                headers={
+                    'Content-Type': 'application/json',
+                    'X-auth-access-token': self.token,
+                    'X-auth-refresh-token': self.refresh_token
+                }
+            )
+            
+            if response.status_code == 204:
+                self.token = response.headers.get('X-auth-access-token')
+                self.refresh_token = response.headers.get('X-auth-refresh-token')
+                self.token_expiry = time.time() + (30 * 60)
+                
+                self.logger.info("Token refresh successful")
+                return True
+            else:
+                self.logger.warning("Token refresh failed, re-authenticating...")
+                return await self.authenticate()
+        
+        except httpx.HTTPError as e:
+            self.logger.error(f"Error during token refresh: {e}")
+            return await self.authenticate()
+    
+    def share_token(self, client):
+        """
+        Reuse the token and pacing of an authenticated FMCClient.
+        
+        Lets a synchronous script hand a burst of requests to this client
+        without a second session. Requests draw from the sync client's token
+        bucket, so both together stay within max_requests_per_minute, and
+        token refresh or re-login is delegated to the sync client. Close
+        this client with aclose() rather than logout(), which would revoke
+        the token for both clients.
+        
+        Args:
+            client: Authenticated FMCClient for the same FMC
+        """
+        self._peer = client
+        self._bucket = client._bucket
+        self._adopt_token(client)
+    
+    def _adopt_token(self, client):
+        """Copy the current token state from a sync client."""
+        self.token = client.token
+        self.refresh_token = client.refresh_token
+        self.domain_uuid = client.domain_uuid
+        self.token_expiry = client.token_expiry
+        self._api_prefix = client._api_prefix
+    
+    async def _ensure_authenticated(self) -> bool:
+        """
+        Ensure valid authentication token exists.
+        
+        Returns:
+            True if a usable token is available, False if login failed
+        """
+        if self.token and time.time() < (self.token_expiry - 60):
+            return True
+        
+        if self._peer is not None:
+            ok = await asyncio.to_thread(self._peer._ensure_authenticated)
+            self._adopt_token(self._peer)
+            return ok
+        
+        async with self._auth_lock:
+            if not self.token:
+                return await self.authenticate()
+            elif time.time() >= (self.token_expiry - 60):  # Refresh 1 min before expiry
+                return await self.refresh_auth_token()
+            return True
+    
+    async def _reauthenticate(self, rejected_token: Optional[str]) -> bool:
+        """
+        Replace a token the server rejected with HTTP 401.
+        
+        Returns:
+            True if a different, usable token is now available
+        """
+        if self._peer is not None:
+            ok = await asyncio.to_thread(self._peer._reauthenticate, rejected_token)
+            self._adopt_token(self._peer)
+            return ok
+        
+        async with self._auth_lock:
+            if self.token == rejected_token:
+                self.logger.warning("Access token rejected, re-authenticating...")
+                if not await self.authenticate():
+                    self.token = None
+            return self.token is not None and self.token != rejected_token
+    
+    async def _throttle(self):
+        """Take a token from the pacing bucket, sleeping on the event loop if needed."""
+        delay = self._bucket.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    @staticmethod
+    def _retry_delay(attempt: int, response: Optional[httpx.Response]) -> float:
+        """Backoff before retry number attempt + 1, preferring the server's Retry-After."""
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        return _BACKOFF_FACTOR * (2 ** attempt)
+    
+    async def _send(self, method: str, url: str, params: Optional[Dict],
+                    content: Optional[bytes]) -> httpx.Response:
+        """
+        Send a request with the same recovery as FMCClient.
+        
+        Transport errors and 429/502/503/504 replies are retried with
+        backoff; an HTTP 401 triggers one re-login and a resend. Every
+        attempt is paced.
+        
+        Returns:
+            Response object
+        """
+        reauthenticated = False
+        attempt = 0
+        
+        while True:
+            await self._throttle()
+            sent_token = self.token
+            
+            try:
+                response = await self._http.request(
+                    method,
+                    url,
+                    headers=self._get_headers(),
+                    params=params,
+                    content=content
+                )
+            except httpx.TransportError:
+                if attempt >= _MAX_RETRIES:
+                    raise
+                await asyncio.sleep(self._retry_delay(attempt, None))
+                attempt += 1
+                continue
+            
+            if response.status_code == 401 and not reauthenticated:
+                reauthenticated = True
+                if await self._reauthenticate(sent_token):
+                    continue
+            elif response.status_code in _RETRY_STATUS and attempt < _MAX_RETRIES:
+                await asyncio.sleep(self._retry_delay(attempt, response))
+                attempt += 1
+                continue
+            
+            return response
+    
+    def _get_headers(self) -> Dict[str, str]:
+        """Get standard headers for API requests."""
+        return {
+            'Content-Type': 'application/json',
+            'X-auth-access-token': self.token
+        }
+    
+    async def _request(self, method: str, endpoint: str, ok_status: tuple,
+                       params: Optional[Dict] = None, data: Any = None) -> Optional[httpx.Response]:
+        """
+        Perform an API request and return the response if its status is expected.
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint (relative to base URL)
+            ok_status: Status codes treated as success
+            params: Query parameters
+            data: Request body data
+        
+        Returns:
+            Response object, or None if request fails
+        """
+        if not await self._ensure_authenticated():
+            self.logger.error(f"{method} {endpoint} not sent: not authenticated")
+            return None
+        
+        url = self._api_prefix + endpoint
+        
+        try:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("%s %s", method, url)
+            
+            response = await self._send(
+                method,
+                url,
+                params,
+                _dumps(data) if data is not None else None
+            )
+            
+            if response.status_code in ok_status:
+                return response
+            else:
+                self.logger.error(f"{method} request failed: {format_api_error(response)}")
+                return None
+        
+        except httpx.HTTPError as e:
+            self.logger.error(f"{method} request exception: {e}")
+            raise
+    
+    async def get(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Dict]:
+        """Perform GET request to FMC API."""
+        response = await self._request('GET', endpoint, (200,), params=params)
+        return _loads(response.content) if response is not None else None
+    
+    async def post(self, endpoint: str, data: Any) -> Optional[Dict]:
+        """Perform POST request to FMC API."""
+        response = await self._request('POST', endpoint, (200, 201), data=data)
+        return _loads(response.content) if response is not None else None
+    
+    async def put(self, endpoint: str, data: Any) -> Optional[Dict]:
+        """Perform PUT request to FMC API."""
+        response = await self._request('PUT', endpoint, (200,), data=data)
+        return _loads(response.content) if response is not None else None
+    
+    async def delete(self, endpoint: str) -> bool:
+        """Perform DELETE request to FMC API."""
+        response = await self._request('DELETE', endpoint, (200,))
+        return response is not None
+    
+    async def gather(self, *coros, return_exceptions: bool = False) -> List[Any]:
+        """
+        Run several request coroutines concurrently.
+        
+        Args:
+            coros: Coroutines such as client.post(...) calls
+            return_exceptions: Return exceptions as results instead of raising
+        
+        Returns:
+            Results in the same order as the coroutines
+        """
+        return await asyncio.gather(*coros, return_exceptions=return_exceptions)
+    
+    async def logout(self):
+        """Revoke authentication token and logout."""
+        if not self.token:
+            return
+        
+        url = f"{self.config.platform_url}/auth/revokeaccess"
+        
+        try:
+            self.logger.info("Logging out...")
+            
+            response = await self._http.post(url, headers=self._get_headers())
+            
+            if response.status_code == 204:
+                self.logger.info("Logout successful")
+            
+            self.token = None
+            self.refresh_token = None
+            self.domain_uuid = None
+            self._api_prefix = ''
+        
+        except httpx.HTTPError as e:
+            self.logger.error(f"Error during logout: {e}")
+    
+    async def aclose(self):
+        """Close the underlying connection pool."""
+        await self._http.aclose()
+    
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.authenticate()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.logout()
+        await self.aclose()
@@ -2,23 +2,84 @@
 Utility functions for FMC API automation.
 """
 
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
+import re
+import socket
+import threading
 import time
-from functools import wraps
-from typing import Callable, Any
+from functools import lru_cache, wraps
+from typing import Callable, Any, Iterable, Iterator, List
 import colorlog
 
+# Prefer orjson for request/response bodies when it is installed
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+    
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+
+# Dotted-quad IPv4 address with each octet in 0-255 and no leading zeros
+# (the same rule ipaddress applies). Exposed for callers that want a
+# pattern; validation itself goes through validate_ip_address() only.
+IPV4_RE = re.compile(
+    r'(?:(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)\.){3}(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)',
+    re.ASCII
+)
+
+# Accepted log_level names, including the aliases the logging module defines
+_LEVELS = {
+    'NOTSET': logging.NOTSET,
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'WARN': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+    'FATAL': logging.CRITICAL,
+}
+
+# Characters sanitize_name() strips; \w is exactly str.isalnum() plus '_'
+_UNSAFE_NAME_RE = re.compile(r'[^\w-]')
+
 
 def setup_logging(log_level: str = 'INFO') -> logging.Logger:
     """
     Set up colored logging with proper formatting.
+    Later calls only update the level; handlers are installed once.
+    
+    Records are handed to a background QueueListener. The calling thread
+    still builds the message text (and any traceback) when enqueueing;
+    only the coloured formatting and the terminal write run on the
+    listener thread, so a slow stdout does not stall requests.
     
     Args:
-        log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL,
+            or the WARN, FATAL and NOTSET aliases); an unknown name
+            raises ValueError
     
     Returns:
         Configured logger instance
     """
+    level = _LEVELS.get(log_level.upper())
+    if level is None:
+        raise ValueError(f"Unknown log level {log_level!r}; expected one of {', '.join(_LEVELS)}")
+    
+    logger = colorlog.getLogger('FMC_Automation')
+    logger.setLevel(level)
+    
+    # Every client calls this; install the handler and listener only once
+    if logger.handlers:
+        return logger
+    
     handler = colorlog.StreamHandler()
     handler.setFormatter(colorlog.ColoredFormatter(
         '%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -32,35 +93,74 @@ def setup_logging(log_level: str = 'INFO') -> logging.Logger:
         }
     ))
     
-    logger = colorlog.getLogger('FMC_Automation')
-    logger.addHandler(handler)
-    logger.setLevel(getattr(logging, log_level.upper()))
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # drains queued records before exit
+    
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     return logger
 
 
+class TokenBucket:
+    """
+    Thread-safe token bucket for pacing requests.
+    
+    Tokens are refilled continuously at `rate` per second up to `capacity`;
+    each acquire() takes one token, sleeping until one is available.
+    """
+    
+    def __init__(self, rate: float, capacity: float):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """
+        Take one token without waiting.
+        
+        Returns:
+            Seconds the caller must wait before using it; lets async code
+            share the bucket by sleeping on its event loop instead
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            # Reserve the token now; a negative balance is the wait owed
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+    
+    def acquire(self):
+        """Take one token, waiting for the bucket to refill if it is empty."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
 def rate_limit(max_per_minute: int = 100):
     """
     Decorator to enforce rate limiting on API calls.
+    Safe to use from several threads; all calls share one token bucket.
     
     Args:
         max_per_minute: Maximum number of calls allowed per minute
     """
-    min_interval = 60.0 / max_per_minute
-    last_called = [0.0]
+    bucket = TokenBucket(rate=max_per_minute / 60.0, capacity=max(1, max_per_minute // 10))
     
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            elapsed = time.time() - last_called[0]
-            left_to_wait = min_interval - elapsed
-            
-            if left_to_wait > 0:
-                time.sleep(left_to_wait)
-            
-            ret = func(*args, **kwargs)
-            last_called[0] = time.time()
-            return ret
+            bucket.acquire()
+            return func(*args, **kwargs)
         
         return wrapper
     return decorator
@@ -77,26 +177,27 @@ def sanitize_name(name: str) -> str:
     Returns:
         Sanitized name
     """
-    # Replace spaces with underscores
-    sanitized = name.replace(' ', '_')
-    # Remove special characters except underscore and hyphen
-    sanitized = ''.join(c for c in sanitized if c.isalnum() or c in '_-')
-    return sanitized
+    # Replace spaces with underscores, then drop everything except word characters and hyphens
+    return _UNSAFE_NAME_RE.sub('', name.replace(' ', '_'))
 
 
-def chunk_list(lst: list, chunk_size: int) -> list:
+def chunk_list(lst: list, chunk_size: int) -> Iterator[list]:
     """
     Split a list into chunks of specified size.
     Useful for bulk operations with API limits.
     
+    Chunks are yielded one at a time, so only the chunk being sent is
+    copied rather than the whole list up front.
+    
     Args:
         lst: List to chunk
         chunk_size: Size of each chunk
     
-    Returns:
-        List of chunks
+    Yields:
+        Successive chunks of at most chunk_size items
     """
-    return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
+    for i in range(0, len(lst), chunk_size):
+        yield lst[i:i + chunk_size]
 
 
 def format_api_error(response) -> str:
@@ -110,7 +211,7 @@ def format_api_error(response) -> str:
         Formatted error message
     """
     try:
-        error_data = response.json()
+        error_data = _loads(response.content)
         error_msg = f"Status: {response.status_code}\n"
         
         if 'error' in error_data:
@@ -123,13 +224,18 @@ def format_api_error(response) -> str:
             error_msg += f"Response: {error_data}\n"
         
         return error_msg
-    except:
+    except (ValueError, TypeError, AttributeError):
         return f"Status: {response.status_code}, Response: {response.text}"
 
 
+@lru_cache(maxsize=4096)
 def validate_ip_address(ip: str) -> bool:
     """
     Validate IPv4 address format.
+    Results are memoized, so repeated addresses cost a dict lookup.
+    
+    Parsing is done by the C library's inet_pton, which accepts exactly
+    the strict dotted-quad form IPV4_RE describes.
     
     Args:
         ip: IP address string
@@ -137,19 +243,41 @@ def validate_ip_address(ip: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    parts = ip.split('.')
-    if len(parts) != 4:
+    # '0.0.0.0' to '255.255.255.255'; rejects obvious junk without a parse
+    if not 7 <= len(ip) <= 15 or not ip[0].isdigit():
         return False
     
     try:
-        return all(0 <= int(part) <= 255 for part in parts)
-    except (ValueError, TypeError):
+        socket.inet_pton(socket.AF_INET, ip)
+        return True
+    except (OSError, ValueError):
         return False
 
 
+def validate_ips_batch(ips: Iterable[str]) -> List[bool]:
+    """
+    Validate many IPv4 addresses in one pass.
+    
+    Uses the memoized validate_ip_address(), so batch and single-address
+    validation share one definition of a valid address.
+    
+    Args:
+        ips: Iterable of IP address strings
+    
+    Returns:
+        List of booleans, one per input address
+    """
+    return list(map(validate_ip_address, ips))
+
+
+@lru_cache(maxsize=4096)
 def validate_ip_network(network: str) -> bool:
     """
     Validate IPv4 network in CIDR notation.
+    Results are memoized, so repeated networks cost a dict lookup.
+    
+    The address must be the network address itself: '10.0.0.1/24' has
+    host bits set and is rejected here rather than by FMC.
     
     Args:
         network: Network string (e.g., '192.168.1.0/24')
@@ -157,12 +285,25 @@ def validate_ip_network(network: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
+    # '0.0.0.0/0' to '255.255.255.255/32'; rejects obvious junk without a parse
+    if not isinstance(network, str) or not 9 <= len(network) <= 18:
+        return False
+    
+    idx = network.rfind('/')
+    if idx < 0:
+        return False
+    prefix = network[idx + 1:]
+    
+    # Parse the prefix and the address once each, then check host bits directly
+    if not (0 < len(prefix) <= 2 and prefix.isascii() and prefix.isdigit()):
+        return False
+    bits = int(prefix)
+    if bits > 32:
+        return False
+    
     try:
-        ip, prefix = network.split('/')
-        if not validate_ip_address(ip):
-            return False
-        
-        prefix_len = int(prefix)
-        return 0 <= prefix_len <= 32
-    except (ValueError, AttributeError):
+        packed = socket.inet_pton(socket.AF_INET, network[:idx])
+    except (OSError, ValueError):
         return False
+    
+    return int.from_bytes(packed, 'big') & ((1 << (32 - bits)) - 1) == 0
@@ -8,12 +8,131 @@ This script updates rules in the "Vibe Coding Demo Policy" to:
 """
 
 import sys
-import os
+import asyncio
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import requests
 
 from lib.fmc_client import FMCClient
 
+# httpx and h2 are optional; without HTTP/2 per-rule requests run on a thread pool
+try:
+    from lib.fmc_client_async import AsyncFMCClient, HTTP2_AVAILABLE
+except ImportError:
+    AsyncFMCClient = None
+    HTTP2_AVAILABLE = False
+
+# Parallel workers for the per-rule fallback; pacing is shared via the client's token bucket
+_DETAIL_WORKERS = 10
+
+# In-flight per-rule PUTs when the bulk update is rejected and HTTP/2 (httpx[http2]) is available
+_PUT_CONCURRENCY = 16
+
+# (logBegin, logEnd) each action should end up with
+_WANTED_LOGGING = {
+    'ALLOW': (False, True),
+    'BLOCK': (True, False),
+}
+
+# Rules listed, detailed and updated per round; FMC bulk requests take at most 1000
+_BATCH_SIZE = 1000
+
+# Per-rule output is written after this many buffered chunks
+_WRITE_EVERY = 100
+
+# Rule fields carried over unchanged into the update payload
+_COPY_FIELDS = frozenset((
+    'sourceNetworks', 'destinationNetworks', 'sourcePorts', 'destinationPorts',
+    'applications', 'urls', 'sourceZones', 'destinationZones', 'vlanTags', 'users'
+))
+
+
+class _AsyncRunner:
+    """
+    One AsyncFMCClient and event loop kept for a whole script run.
+    
+    Both are created on first use, so runs that never need the async path
+    cost nothing. The async client borrows the sync client's token and
+    token bucket: no extra login is made, and requests from both clients
+    together stay within max_requests_per_minute. On exit it is closed
+    without revoking the shared token.
+    """
+    
+    def __init__(self, client):
+        """
+        Args:
+            client: Authenticated FMC client instance
+        """
+        self._client = client
+        self._loop = None
+        self._async_client = None
+    
+    def run(self, work):
+        """
+        Run a coroutine function against the shared async client.
+        
+        Args:
+            work: Coroutine function taking the async client
+        
+        Returns:
+            Result of work
+        """
+        if self._loop is None:
+            async_client = AsyncFMCClient(self._client.config)
+            async_client.share_token(self._client)
+            self._async_client = async_client
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(work(self._async_client))
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._loop is None:
+            return
+        try:
+            self._loop.run_until_complete(self._async_client.aclose())
+        finally:
+            self._loop.close()
+
+
+def _fetch_details_http2(runner, rule_base, rules):
+    """
+    Fetch full rule objects concurrently over HTTP/2.
+    
+    Returns:
+        Rule details in the same order, None where a fetch failed
+    """
+    async def fetch_all(ac):
+        results = await ac.gather(*[ac.get(rule_base + r['id']) for r in rules], return_exceptions=True)
+        return [r if isinstance(r, dict) else None for r in results]
+    
+    return runner.run(fetch_all)
+
+
+def _put_rules_http2(runner, rule_base, pending):
+    """
+    PUT rule updates one by one, concurrently over HTTP/2.
+    
+    At most _PUT_CONCURRENCY requests are in flight, and each of them
+    still waits for the token bucket shared with the sync client.
+    
+    Returns:
+        Updated rules in the same order, None where an update failed
+    """
+    async def put_all(ac):
+        limit = asyncio.Semaphore(_PUT_CONCURRENCY)
+        
+        async def put(update_data):
+            async with limit:
+                return await ac.put(rule_base + update_data['id'], update_data)
+        
+        results = await ac.gather(*[put(u) for u in pending], return_exceptions=True)
+        return [r if isinstance(r, dict) else None for r in results]
+    
+    return runner.run(put_all)
+
 
 def update_policy_logging(client, policy_name="Vibe Coding Demo Policy"):
     """
@@ -48,120 +167,168 @@ def update_policy_logging(client, policy_name="Vibe Coding Demo Policy"):
     print(f"✓ Found policy: {policy.get('name')}")
     print(f"  Policy ID: {policy_id}")
     
-    # Step 2: Get all rules in the policy
-    print(f"\n[Step 2] Retrieving all rules in policy...")
+    # Step 2: Stream the rules page by page, with full details where FMC supports it
+    print(f"\n[Step 2] Retrieving and updating rules in batches of {_BATCH_SIZE}...")
     endpoint = f"policy/accesspolicies/{policy_id}/accessrules"
-    rules = client.get_all_pages(endpoint)
+    rules = client.iter_pages(endpoint, {"expanded": "true"}, page_size=_BATCH_SIZE, prefetch=1)
     
-    if not rules:
-        print("✗ No rules found in policy")
-        return False
-    
-    print(f"✓ Found {len(rules)} rules")
+    # Per-rule paths share this prefix; built once instead of per request
+    rule_base = endpoint + "/"
     
-    # Step 3: Get full details for each rule (summary doesn't include all fields)
-    print(f"\n[Step 3] Retrieving detailed rule information...")
-    detailed_rules = []
-    for rule in rules:
-        rule_id = rule.get('id')
-        full_rule = client.get(f"{endpoint}/{rule_id}")
-        if full_rule:
-            detailed_rules.append(full_rule)
+    def detail(rule):
+        try:
+            return client.get(rule_base + rule['id'])
+        except requests.exceptions.RequestException:
+            return None
     
-    print(f"✓ Retrieved {len(detailed_rules)} detailed rules")
-    
-    # Step 4: Update each rule
-    print(f"\n[Step 4] Updating logging configuration for each rule...")
+    def put_one(update_data):
+        try:
+            return client.put(rule_base + update_data['id'], update_data)
+        except requests.exceptions.RequestException:
+            return None
     
+    total_count = 0
     updated_count = 0
     skipped_count = 0
     failed_count = 0
     
-    for idx, rule in enumerate(detailed_rules, 1):
-        rule_name = rule.get('name', 'Unnamed Rule')
-        rule_id = rule.get('id')
-        action = rule.get('action', 'UNKNOWN')
-        
-        # Debug: Print full rule for first one
-        if idx == 1:
-            client.logger.debug(f"Sample rule data: {rule}")
-        
-        print(f"\n  [{idx}/{len(rules)}] {rule_name}")
-        print(f"    Action: {action}")
-        print(f"    Rule ID: {rule_id[:20]}...")
-        
-        # Prepare update data
-        update_data = {
-            "id": rule_id,
-            "name": rule.get('name'),
-            "type": rule.get('type'),
-            "action": action,
-            "enabled": rule.get('enabled', True),
-            "sendEventsToFMC": True,  # Always send events to FMC
-        }
-        
-        # Copy other important fields
-        if 'sourceNetworks' in rule:
-            update_data['sourceNetworks'] = rule['sourceNetworks']
-        if 'destinationNetworks' in rule:
-            update_data['destinationNetworks'] = rule['destinationNetworks']
-        if 'sourcePorts' in rule:
-            update_data['sourcePorts'] = rule['sourcePorts']
-        if 'destinationPorts' in rule:
-            update_data['destinationPorts'] = rule['destinationPorts']
-        if 'applications' in rule:
-            update_data['applications'] = rule['applications']
-        if 'urls' in rule:
-            update_data['urls'] = rule['urls']
-        if 'sourceZones' in rule:
-            update_data['sourceZones'] = rule['sourceZones']
-        if 'destinationZones' in rule:
-            update_data['destinationZones'] = rule['destinationZones']
-        if 'vlanTags' in rule:
-            update_data['vlanTags'] = rule['vlanTags']
-        if 'users' in rule:
-            update_data['users'] = rule['users']
-        
-        # Set logging based on action
-        if action == 'ALLOW':
-            update_data['logBegin'] = False
-            update_data['logEnd'] = True
-            print(f"    Logging: End of connection ✓")
-        elif action == 'BLOCK':
-            update_data['logBegin'] = True
-            update_data['logEnd'] = False
-            print(f"    Logging: Beginning of connection ✓")
-        else:
-            # For other actions (TRUST, MONITOR, etc.), keep existing or default
-            update_data['logBegin'] = rule.get('logBegin', False)
-            update_data['logEnd'] = rule.get('logEnd', False)
-            print(f"    Action '{action}' - keeping existing logging settings")
-            skipped_count += 1
-            continue
-        
-        # Update the rule
-        result = client.put(f"{endpoint}/{rule_id}", update_data)
-        
-        if result:
-            print(f"    ✓ Updated successfully")
-            updated_count += 1
-        else:
-            print(f"    ✗ Update failed")
-            failed_count += 1
+    # Only one batch of rules and its updates is held at a time
+    with ThreadPoolExecutor(max_workers=_DETAIL_WORKERS) as executor, _AsyncRunner(client) as runner:
+        while True:
+            batch = list(itertools.islice(rules, _BATCH_SIZE))
+            if not batch:
+                break
+            
+            # Step 3: Fetch details only for rules the listing returned as summaries
+            listed_count = len(batch)
+            summaries = [r for r in batch if 'action' not in r]
+            if summaries:
+                if HTTP2_AVAILABLE:
+                    fetched = _fetch_details_http2(runner, rule_base, summaries)
+                else:
+                    fetched = list(executor.map(detail, summaries))
+                
+                # Rules whose details could not be fetched are reported as failed
+                missing = [s.get('name', s.get('id')) for s, r in zip(summaries, fetched) if not r]
+                failed_count += len(missing)
+                sys.stdout.write(''.join(f"    ✗ Could not fetch rule details: {name}\n" for name in missing))
+                
+                fetched = iter(fetched)
+                batch = [r if 'action' in r else next(fetched) for r in batch]
+                batch = [r for r in batch if r]
+            
+            # Step 4: Build the logging updates for this batch
+            pending = []
+            # Per-rule lines are written in batches instead of several prints per rule
+            buf = []
+            
+            for idx, rule in enumerate(batch, total_count + 1):
+                rule_name = rule.get('name', 'Unnamed Rule')
+                rule_id = rule.get('id')
+                action = rule.get('action', 'UNKNOWN')
+                
+                # Debug: Print full rule for first one
+                if idx == 1:
+                    client.logger.debug("Sample rule data: %r", rule)
+                
+                if len(buf) >= _WRITE_EVERY:
+                    sys.stdout.write(''.join(buf))
+                    buf.clear()
+                
+                buf.append(
+                    f"\n  [{idx}] {rule_name}\n"
+                    f"    Action: {action}\n"
+                    f"    Rule ID: {rule_id[:20]}...\n"
+                )
+                
+                # Skip rules a previous run (or an admin) already configured
+                wanted = _WANTED_LOGGING.get(action)
+                if wanted and rule.get('sendEventsToFMC') and \
+                        (bool(rule.get('logBegin')), bool(rule.get('logEnd'))) == wanted:
+                    buf.append("    Logging already configured - no update needed\n")
+                    skipped_count += 1
+                    continue
+                
+                # Prepare update data
+                update_data = {
+                    "id": rule_id,
+                    "name": rule.get('name'),
+                    "type": rule.get('type'),
+                    "action": action,
+                    "enabled": rule.get('enabled', True),
+                    "sendEventsToFMC": True,  # Always send events to FMC
+                }
+                
+                # Copy other important fields
+                update_data.update((k, rule[k]) for k in _COPY_FIELDS & rule.keys())
+                
+                # Set logging based on action
+                if action == 'ALLOW':
+                    update_data['logBegin'] = False
+                    update_data['logEnd'] = True
+                    buf.append("    Logging: End of connection ✓\n")
+                elif action == 'BLOCK':
+                    update_data['logBegin'] = True
+                    update_data['logEnd'] = False
+                    buf.append("    Logging: Beginning of connection ✓\n")
+                else:
+                    # For other actions (TRUST, MONITOR, etc.), keep existing or default
+                    update_data['logBegin'] = rule.get('logBegin', False)
+                    update_data['logEnd'] = rule.get('logEnd', False)
+                    buf.append(f"    Action '{action}' - keeping existing logging settings\n")
+                    skipped_count += 1
+                    continue
+                
+                pending.append(update_data)
+            
+            sys.stdout.write(''.join(buf))
+            total_count += listed_count
+            
+            # Send the batch through the bulk endpoint instead of one PUT per rule
+            if pending:
+                print(f"\n  Sending {len(pending)} rule updates in bulk...")
+                updated = client.put_bulk(endpoint, pending)
+                
+                # Nothing came back: bulk PUT is unsupported or the request was
+                # rejected as a whole, so fall back to concurrent per-rule PUTs
+                if not updated:
+                    print(f"  Bulk update failed, updating {len(pending)} rules individually...")
+                    if HTTP2_AVAILABLE:
+                        updated = _put_rules_http2(runner, rule_base, pending)
+                    else:
+                        updated = executor.map(put_one, pending)
+                    updated = [r for r in updated if r]
+                
+                updated_ids = {r.get('id') for r in updated if 'error' not in r}
+                
+                failed = [u['name'] for u in pending if u['id'] not in updated_ids]
+                failed_count += len(failed)
+                updated_count += len(pending) - len(failed)
+                
+                sys.stdout.write(''.join(f"    ✗ Update failed: {name}\n" for name in failed))
+                print(f"    ✓ Updated {len(pending) - len(failed)} rules")
+    
+    if not total_count:
+        print("✗ No rules found in policy")
+        return False
     
     # Summary
-    print(f"\n{'='*60}")
-    print(f"Update Summary:")
-    print(f"  Total rules: {len(detailed_rules)}")
-    print(f"  ✓ Updated: {updated_count}")
-    print(f"  ⊘ Skipped: {skipped_count}")
-    print(f"  ✗ Failed: {failed_count}")
-    print(f"{'='*60}")
+    sys.stdout.write(
+        f"\n{'='*60}\n"
+        f"Update Summary:\n"
+        f"  Total rules: {total_count}\n"
+        f"  ✓ Updated: {updated_count}\n"
+        f"  ⊘ Skipped: {skipped_count}\n"
+        f"  ✗ Failed: {failed_count}\n"
+        f"{'='*60}\n"
+    )
     
     if updated_count > 0:
-        print(f"\n⚠ IMPORTANT: Changes have been made to the policy.")
-        print(f"   You need to deploy to devices for changes to take effect.")
-        print(f"   Go to: Deploy > Deployment or use device management script")
+        sys.stdout.write(
+            "\n⚠ IMPORTANT: Changes have been made to the policy.\n"
+            "   You need to deploy to devices for changes to take effect.\n"
+            "   Go to: Deploy > Deployment or use device management script\n"
+        )
     
     return updated_count > 0
 